@@ -9,49 +9,54 @@ Defines the interface and implementations for audio sources:
 
 import logging
 import math
+import mmap
+import os
 import struct
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 
 from turntabler.diagnostics import StreamingDiagnostics
 from turntabler.usb_audio import detect_usb_audio_device
 from turntabler.usb_audio_capture import (CaptureConfig, SampleFormat,
-                                          USBAudioCapture)
+                                          USBAudioCapture, convert_to_s16)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioFormat:
-    """Audio format specification."""
+    """
+    Audio format specification.
+
+    Immutable; derived sizes are computed once at construction and stored
+    as plain attributes, since they are read on the streaming hot path.
+    """
 
     sample_rate: int = 48000
     channels: int = 2
     bits_per_sample: int = 16
 
-    @property
-    def bytes_per_sample(self) -> int:
-        """Bytes per audio sample (all channels)."""
-        return self.channels * self.bits_per_sample // 8
-
-    @property
-    def byte_rate(self) -> int:
-        """Bytes per second."""
-        return self.sample_rate * self.bytes_per_sample
+    # Derived values (set in __post_init__)
+    bytes_per_sample: int = field(init=False)  # Bytes per audio sample (all channels)
+    byte_rate: int = field(init=False)  # Bytes per second
+    block_align: int = field(init=False)  # Bytes per sample frame (all channels)
+    bandwidth_mbps: float = field(init=False)  # Network bandwidth in Mbps
 
-    @property
-    def block_align(self) -> int:
-        """Bytes per sample frame (all channels)."""
-        return self.bytes_per_sample
-
-    @property
-    def bandwidth_mbps(self) -> float:
-        """Network bandwidth in Mbps."""
-        return (self.byte_rate * 8) / 1_000_000
+    def __post_init__(self):
+        bytes_per_sample = self.channels * self.bits_per_sample // 8
+        byte_rate = self.sample_rate * bytes_per_sample
+        object.__setattr__(self, "bytes_per_sample", bytes_per_sample)
+        object.__setattr__(self, "byte_rate", byte_rate)
+        object.__setattr__(self, "block_align", bytes_per_sample)
+        object.__setattr__(self, "bandwidth_mbps", (byte_rate * 8) / 1_000_000)
 
 
 class AudioSource(ABC):
     """Base class for audio sources."""
 
+    # True if read_chunk is paced by a hardware clock. Sources that generate
+    # or read data as fast as they are asked outrun any real-time client.
+    realtime = False
+
     @abstractmethod
     def read_chunk(self, num_frames: int) -> Optional[bytes]:
         """
@@ -134,7 +139,9 @@ class FileAudioSource(AudioSource):
     """
     Read audio from a WAV file.
 
-    Loops indefinitely for continuous playback testing.
+    Loops indefinitely for continuous playback testing. The file is
+    memory-mapped once, so each chunk is a single slice of the mapping
+    rather than a buffered read through the Python I/O stack.
     """
 
     def __init__(self, file_path: str, format: AudioFormat):
@@ -148,53 +155,86 @@ class FileAudioSource(AudioSource):
         self.file_path = file_path
         self.format = format
         self._file = None
+        self._map: Optional[mmap.mmap] = None
         self._data_start = 0
+        self._data_end = 0
+        self._pos = 0
+        self._wrap_buf = bytearray()
         self._open()
 
     def _open(self):
-        """Open WAV file and locate data chunk."""
+        """Open and map WAV file, then locate data chunk."""
         self._file = open(self.file_path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        if size == 0:
+            return
+
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data_end = size
 
         # Parse WAV header
-        header = self._file.read(12)
-        if not header.startswith(b"RIFF"):
+        if self._map[:4] != b"RIFF":
             # Assume raw PCM
-            self._file.seek(0)
             self._data_start = 0
+            self._pos = 0
             return
 
         # Find data chunk
-        while True:
-            chunk_header = self._file.read(8)
-            if not chunk_header:
-                break
-
-            chunk_id = chunk_header[:4]
-            chunk_size = struct.unpack("<I", chunk_header[4:8])[0]
+        offset = 12
+        while offset + 8 <= size:
+            chunk_id = self._map[offset : offset + 4]
+            chunk_size = struct.unpack_from("<I", self._map, offset + 4)[0]
+            offset += 8
 
             if chunk_id == b"data":
-                self._data_start = self._file.tell()
+                self._data_start = offset
+                # Streaming-style headers use 0xFFFFFFFF; clamp to the file
+                self._data_end = min(offset + chunk_size, size)
                 break
             else:
-                self._file.seek(chunk_size, 1)
+                offset += chunk_size
+
+        self._pos = self._data_start
 
     def read_chunk(self, num_frames: int) -> Optional[bytes]:
         """Read audio chunk from file."""
-        if not self._file:
+        if not self._map or self._data_end <= self._data_start:
             return None
 
         chunk_size = num_frames * self.format.bytes_per_sample
-        data = self._file.read(chunk_size)
 
-        if not data:
+        if self._pos >= self._data_end:
             # Loop back to start
-            self._file.seek(self._data_start)
-            data = self._file.read(chunk_size)
-
-        return data if data else None
+            self._pos = self._data_start
+
+        end = self._pos + chunk_size
+        if end <= self._data_end:
+            data = self._map[self._pos : end]
+            self._pos = end
+            return data
+
+        # Loop boundary: fill a full chunk from the tail and the start of the
+        # data, copying both parts into a reused buffer instead of concatenating
+        if len(self._wrap_buf) != chunk_size:
+            self._wrap_buf = bytearray(chunk_size)
+        view = memoryview(self._wrap_buf)
+        filled = 0
+        while filled < chunk_size:
+            if self._pos >= self._data_end:
+                self._pos = self._data_start
+            n = min(chunk_size - filled, self._data_end - self._pos)
+            view[filled : filled + n] = self._map[self._pos : self._pos + n]
+            self._pos += n
+            filled += n
+        view.release()
+
+        return bytes(self._wrap_buf)
 
     def close(self):
         """Close file."""
+        if self._map:
+            self._map.close()
+            self._map = None
         if self._file:
             self._file.close()
             self._file = None
@@ -208,11 +248,14 @@ class USBAudioSource(AudioSource):
     interfaces like the Behringer UCA202/UCA222.
     """
 
+    realtime = True
+
     def __init__(
         self,
         format: AudioFormat,
         device: Optional[str] = None,
         diagnostics: Optional[StreamingDiagnostics] = None,
+        capture_format: SampleFormat = SampleFormat.S16_LE,
     ):
         """
         Initialize USB audio source.
@@ -222,6 +265,8 @@ class USBAudioSource(AudioSource):
             device: ALSA device name (e.g., 'hw:CARD=CODEC,DEV=0').
                    If None, auto-detects first USB audio device.
             diagnostics: Optional diagnostics collector for performance metrics
+            capture_format: Native sample format of the interface. 24/32-bit
+                   captures are converted to the 16-bit PCM the stream carries.
 
         Raises:
             RuntimeError: If no USB audio device found or failed to open
@@ -235,6 +280,8 @@ class USBAudioSource(AudioSource):
         """
         self.format = format
         self.diagnostics = diagnostics
+        self.capture_format = capture_format
+        self._convert_buf = bytearray()
         self.logger = logging.getLogger(__name__)
 
         # Auto-detect device if not specified
@@ -252,7 +299,7 @@ class USBAudioSource(AudioSource):
         # Validate format compatibility
         if format.bits_per_sample != 16:
             self.logger.warning(
-                f"UCA202/UCA222 only supports 16-bit audio. "
+                f"Stream output is 16-bit PCM. "
                 f"Requested {format.bits_per_sample}-bit will use 16-bit."
             )
 
@@ -262,14 +309,17 @@ class USBAudioSource(AudioSource):
             device=device,
             sample_rate=format.sample_rate,
             channels=format.channels,
-            sample_format=SampleFormat.S16_LE,  # UCA202 native format
+            sample_format=capture_format,  # S16_LE is UCA202 native format
             period_size=2048,  # ~42ms per period
             periods=4,  # Total buffer: ~170ms
         )
 
         # Initialize capture
         self.logger.info(f"Opening USB audio device: {device}")
-        self.capture = USBAudioCapture(config, diagnostics=self.diagnostics)
+        # Adaptive periods: grow the buffer on a loaded Pi instead of overrunning
+        self.capture = USBAudioCapture(
+            config, diagnostics=self.diagnostics, adaptive_periods=True
+        )
 
         if not self.capture.open():
             raise RuntimeError(
@@ -304,7 +354,7 @@ class USBAudioSource(AudioSource):
 
         try:
             # Pull next chunk from capture stream
-            return next(self._stream)
+            data = next(self._stream)
         except StopIteration:
             self.logger.info("USB capture stream ended")
             return None
@@ -312,6 +362,17 @@ class USBAudioSource(AudioSource):
             self.logger.error(f"USB audio capture error: {e}")
             return None
 
+        if self.capture_format == SampleFormat.S16_LE:
+            return data
+
+        # Convert into the reused buffer, then take a single immutable copy
+        # (chunks outlive this call in the stream buffer, so the buffer itself
+        # can't be handed out). Slicing through a memoryview avoids an extra
+        # intermediate bytearray per period.
+        size = convert_to_s16(data, self.capture_format, self._convert_buf)
+        with memoryview(self._convert_buf) as view:
+            return bytes(view[:size])
+
     def close(self):
         """Close USB audio capture and release ALSA resources."""
         if hasattr(self, "_stream") and self._stream:
@@ -61,6 +61,9 @@ def stream(
     frequency: Annotated[
         float, typer.Option("--frequency", help="Tone frequency for synthetic (Hz)")
     ] = 440.0,
+    sample_rate: Annotated[
+        int, typer.Option("--sample-rate", help="Sample rate for synthetic (Hz)")
+    ] = 44100,
     # Sonos configuration
     sonos_ip: Annotated[
         Optional[str],
@@ -127,7 +130,9 @@ def stream(
     # Determine audio source type
     if synthetic:
         source_type = "synthetic"
-        typer.echo(f"🎵 Audio source: Synthetic ({frequency}Hz sine wave)")
+        typer.echo(
+            f"🎵 Audio source: Synthetic ({frequency}Hz sine wave at {sample_rate}Hz)"
+        )
     elif file:
         if not file.exists():
             typer.secho(f"Error: File not found: {file}", fg=typer.colors.RED, err=True)
@@ -172,6 +177,7 @@ def stream(
         streamer = TurnTablerStreamer(
             sonos_ip=sonos_ip,
             audio_frequency=frequency,
+            synthetic_sample_rate=sample_rate,
             test_duration_seconds=None,  # Run indefinitely
             host=host,
             port=port,
@@ -286,6 +292,10 @@ def test_full(
     device: Annotated[
         Optional[str], typer.Option("--device", help="USB ALSA device (for USB source)")
     ] = None,
+    sample_rate: Annotated[
+        int,
+        typer.Option("--sample-rate", help="Sample rate for synthetic source (Hz)"),
+    ] = 44100,
     port: Annotated[int, typer.Option("--port", help="Server port")] = 5901,
     verbose: Annotated[
         bool, typer.Option("--verbose", "-v", help="Enable debug logging")
@@ -318,6 +328,7 @@ def test_full(
     try:
         streamer = TurnTablerStreamer(
             sonos_ip=sonos_ip,
+            synthetic_sample_rate=sample_rate,
             test_duration_seconds=duration,
             port=port,
             stream_name="TurnTabler Full Test",
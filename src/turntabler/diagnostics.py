@@ -6,6 +6,7 @@ and tuning audio streaming performance.
 """
 
 import logging
+import math
 import statistics
 import time
 from dataclasses import dataclass, field
@@ -166,6 +167,12 @@ class StreamingDiagnostics:
         now = time.time()
         return (now - self.last_summary_time) >= self.summary_interval
 
+    def seconds_until_summary(self) -> float:
+        """Seconds until the next periodic summary is due (inf if disabled)."""
+        if not self.enabled:
+            return math.inf
+        return max(0.0, self.last_summary_time + self.summary_interval - time.time())
+
     def periodic_summary(self) -> str:
         """
         Generate periodic summary of recent metrics.
@@ -173,7 +180,11 @@ class StreamingDiagnostics:
         Returns:
             Formatted summary string
         """
-        if not self.enabled or not self.chunk_sizes:
+        if not self.enabled:
+            return ""
+        if not self.chunk_sizes:
+            # Nothing to report yet; start the next interval from now
+            self.last_summary_time = time.time()
             return ""
 
         now = time.time()
@@ -11,15 +11,22 @@ This module provides the production streaming pipeline:
 Extracted from validated e2e test code - production-ready.
 """
 
+import asyncio
+import errno
 import logging
+import queue
+import select
 import socket
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from types import FrameType
+from typing import Callable, Optional
 
 import uvicorn
+import uvloop
 from soco import SoCo, discover
 
 from turntabler.audio_source import (AudioFormat, FileAudioSource,
@@ -30,6 +37,87 @@ from turntabler.streaming_wav import WAVStreamingServer
 logger = logging.getLogger(__name__)
 
 
+def wait_for_playback(device: SoCo, timeout: float = 10.0) -> str:
+    """
+    Wait for a Sonos device to start (or fail to start) playing.
+
+    Subscribes to the device's AVTransport UPnP events and returns as soon
+    as the transport state reaches PLAYING or STOPPED, rather than polling
+    transport info once a second. Falls back to a single poll if the
+    subscription can't be set up, or if no event settles the state in time
+    (e.g. NOTIFYs blocked by a firewall on this host's event listener).
+
+    Args:
+        device: Sonos device (group coordinator) that was sent play_uri
+        timeout: Maximum seconds to wait
+
+    Returns:
+        Last transport state seen (e.g. "PLAYING", "STOPPED", "TRANSITIONING")
+    """
+    try:
+        sub = device.avTransport.subscribe(
+            requested_timeout=int(timeout) + 5, auto_renew=False
+        )
+    except Exception as e:
+        logger.warning(f"Event subscription failed ({e}) - polling once")
+        info = device.get_current_transport_info()
+        return info["current_transport_state"]
+
+    state = "UNKNOWN"
+    deadline = time.monotonic() + timeout
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                event = sub.events.get(timeout=remaining)
+            except queue.Empty:
+                break
+
+            new_state = event.variables.get("transport_state")
+            if not new_state or new_state == state:
+                continue
+            state = new_state
+            logger.info(f"  State: {state}")
+
+            if state in ("PLAYING", "STOPPED"):
+                break
+    finally:
+        try:
+            sub.unsubscribe()
+        except Exception as e:
+            logger.debug(f"Event unsubscribe failed: {e}")
+
+    if state not in ("PLAYING", "STOPPED"):
+        logger.warning(f"No final state from events ({state}) - polling once")
+        info = device.get_current_transport_info()
+        state = info["current_transport_state"]
+
+    return state
+
+
+class _StreamServer(uvicorn.Server):
+    """
+    uvicorn server that hands Ctrl+C/SIGTERM to the streamer.
+
+    uvicorn captures exit signals while serving and would begin its own
+    shutdown, waiting indefinitely on the open stream connection. Instead
+    the first signal asks the streamer to stop, and the streamer stops
+    Sonos and the producer before shutting the server down. A second
+    signal falls back to uvicorn's own handling.
+    """
+
+    def __init__(self, config: uvicorn.Config, on_exit: Callable[[], None]):
+        super().__init__(config)
+        self._on_exit = on_exit
+        self._exit_requested = False
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        if self._exit_requested:
+            super().handle_exit(sig, frame)
+            return
+        self._exit_requested = True
+        self._on_exit()
+
+
 @dataclass
 class StreamingStats:
     """Statistics from a streaming session"""
@@ -54,10 +142,14 @@ class TurnTablerStreamer:
     audio source changes (USB for production, synthetic/file for testing).
     """
 
+    STATUS_INTERVAL = 60  # Seconds between status lines while streaming
+    SONOS_STOP_TIMEOUT = 2.0  # Max seconds to wait for Sonos stop at shutdown
+
     def __init__(
         self,
         sonos_ip: Optional[str] = None,
         audio_frequency: float = 440.0,
+        synthetic_sample_rate: int = 44100,
         test_duration_seconds: Optional[int] = None,
         host: str = "0.0.0.0",
         port: int = 5901,
@@ -71,6 +163,8 @@ class TurnTablerStreamer:
         Args:
             sonos_ip: IP of Sonos speaker (auto-detect if None)
             audio_frequency: Synthetic audio frequency (Hz)
+            synthetic_sample_rate: Sample rate for the synthetic source (Hz);
+                USB and file sources always use 48kHz
             test_duration_seconds: How long to stream (None = indefinite)
             host: HTTP server bind address
             port: HTTP server bind port
@@ -80,6 +174,7 @@ class TurnTablerStreamer:
         """
         self.sonos_ip = sonos_ip
         self.audio_frequency = audio_frequency
+        self.synthetic_sample_rate = synthetic_sample_rate
         self.test_duration_seconds = test_duration_seconds
         self.host = host
         self.port = port
@@ -87,19 +182,23 @@ class TurnTablerStreamer:
         self.debug = debug
         self.debug_interval = debug_interval
 
+        # One format shared by the audio source and the WAV header
+        self.audio_format = AudioFormat()
+
         self.sonos = None
         self.server = None
         self.audio_source = None
         self.start_time = None
-        self.stop_requested = False
+        self._stop_event = asyncio.Event()
+        self._local_ip: Optional[str] = None
+        self._sonos_name: Optional[str] = None
+        self._sonos_ip: Optional[str] = None
+        self._http_server: Optional[uvicorn.Server] = None
+        self._server_task: Optional[asyncio.Task] = None
         self.diagnostics = None
 
     def discover_sonos(self) -> Optional[SoCo]:
         """Discover Sonos speaker on network."""
-        if not discover:
-            logger.error("SoCo not installed. Install with: pip install soco")
-            return None
-
         logger.info("Discovering Sonos devices...")
         devices = discover(timeout=5)
 
@@ -107,22 +206,31 @@ class TurnTablerStreamer:
             logger.error("No Sonos devices found on network")
             return None
 
-        for device in devices:
-            logger.info(f"  Found: {device.player_name} ({device.ip_address})")
+        # Return specified IP as soon as it's found (ip_address is local,
+        # while player_name may need a network round-trip)
+        if self.sonos_ip:
+            for device in devices:
+                if device.ip_address == self.sonos_ip:
+                    logger.info(f"Using specified device: {device.player_name}")
+                    return device
 
-        # Return first device or specified IP
         for device in devices:
-            if self.sonos_ip and device.ip_address == self.sonos_ip:
-                logger.info(f"Using specified device: {device.player_name}")
-                return device
+            logger.info(f"  Found: {device.player_name} ({device.ip_address})")
 
         # Use first device
-        sonos = list(devices)[0]
+        sonos = next(iter(devices))
         logger.info(f"Using device: {sonos.player_name} ({sonos.ip_address})")
         return sonos
 
     def get_local_ip(self) -> str:
-        """Get local IP address for streaming URL."""
+        """
+        Get local IP address for streaming URL.
+
+        Resolved once per streamer; the interface doesn't change mid-session.
+        """
+        if self._local_ip is not None:
+            return self._local_ip
+
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         try:
             # Connect to external host to determine local IP
@@ -134,6 +242,7 @@ class TurnTablerStreamer:
         finally:
             s.close()
 
+        self._local_ip = ip
         return ip
 
     def setup_audio_source(
@@ -149,12 +258,16 @@ class TurnTablerStreamer:
         Returns:
             True if successful
         """
-        audio_format = AudioFormat()
-
         if source_type == "synthetic":
-            logger.info(f"Creating synthetic audio source ({self.audio_frequency}Hz)")
+            # Synthetic audio only validates the pipeline, so it can run at
+            # a lower rate to leave more CPU headroom
+            self.audio_format = AudioFormat(sample_rate=self.synthetic_sample_rate)
+            logger.info(
+                f"Creating synthetic audio source ({self.audio_frequency}Hz tone, "
+                f"{self.synthetic_sample_rate}Hz sample rate)"
+            )
             self.audio_source = SyntheticAudioSource(
-                format=audio_format, frequency=self.audio_frequency, amplitude=0.5
+                format=self.audio_format, frequency=self.audio_frequency, amplitude=0.5
             )
             return True
 
@@ -165,14 +278,14 @@ class TurnTablerStreamer:
                 return False
 
             logger.info(f"Creating file audio source: {file_path}")
-            self.audio_source = FileAudioSource(file_path, audio_format)
+            self.audio_source = FileAudioSource(file_path, self.audio_format)
             return True
 
         elif source_type == "usb":
             logger.info("Creating USB audio source")
             try:
                 self.audio_source = USBAudioSource(
-                    audio_format, device=device, diagnostics=self.diagnostics
+                    self.audio_format, device=device, diagnostics=self.diagnostics
                 )
                 logger.info("USB audio source initialized")
                 return True
@@ -191,10 +304,9 @@ class TurnTablerStreamer:
             return False
 
         try:
-            audio_format = AudioFormat()
             self.server = WAVStreamingServer(
                 audio_source=self.audio_source,
-                wav_format=audio_format,
+                wav_format=self.audio_format,
                 stream_name=self.stream_name,
                 diagnostics=self.diagnostics,
             )
@@ -206,10 +318,6 @@ class TurnTablerStreamer:
 
     def setup_sonos(self) -> bool:
         """Setup Sonos speaker connection."""
-        if not SoCo:
-            logger.warning("SoCo not installed - skipping Sonos setup")
-            return True  # Continue anyway
-
         # Connect to device
         device = None
         if self.sonos_ip:
@@ -238,7 +346,10 @@ class TurnTablerStreamer:
             logger.info("  Device is standalone (not grouped)")
             self.sonos = device
 
-        logger.info(f"  Sending commands to: {self.sonos.player_name}")
+        # Snapshot identity once; player_name can cost a SOAP round-trip
+        self._sonos_name = self.sonos.player_name
+        self._sonos_ip = self.sonos.ip_address
+        logger.info(f"  Sending commands to: {self._sonos_name} ({self._sonos_ip})")
         return True
 
     def start_streaming(self) -> bool:
@@ -252,40 +363,40 @@ class TurnTablerStreamer:
             stream_url = f"http://{local_ip}:{self.port}/stream.wav"
 
             logger.info(f"Starting streaming: {stream_url}")
-            logger.info(f"Target: {self.sonos.player_name}")
-
-            # Check volume and device state
-            logger.info(f"  Volume: {self.sonos.volume}%")
-            logger.info(f"  Muted: {self.sonos.mute}")
-
-            # Start playback
-            self.sonos.play_uri(
-                uri=stream_url,
-                title=self.stream_name,
-                start=True,
-                force_radio=False,  # Plain HTTP, no force_radio
-            )
+            logger.info(f"Target: {self._sonos_name}")
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                # Start playback in the background; the device state reads
+                # below are separate SOAP calls and overlap with it
+                play = executor.submit(
+                    self.sonos.play_uri,
+                    uri=stream_url,
+                    title=self.stream_name,
+                    start=True,
+                    force_radio=False,  # Plain HTTP, no force_radio
+                )
+
+                # Check volume and device state
+                logger.info(f"  Volume: {self.sonos.volume}%")
+                logger.info(f"  Muted: {self.sonos.mute}")
+
+                play.result()
 
             logger.info("Playback started on Sonos")
 
             # Monitor initial state transitions
             logger.info("Monitoring state transitions...")
-            for i in range(10):
-                time.sleep(1)
-                try:
-                    info = self.sonos.get_current_transport_info()
-                    state = info["current_transport_state"]
-                    track = self.sonos.get_current_track_info().get("title", "N/A")
-                    logger.info(f"  [{i + 1}s] State: {state:12} | Title: {track}")
-
-                    if state == "PLAYING":
-                        logger.info("✅ Audio is playing!")
-                        return True
-                    elif state == "STOPPED":
-                        logger.warning("Playback stopped")
-                        return False
-                except Exception as e:
-                    logger.warning(f"Error checking status: {e}")
+            try:
+                state = wait_for_playback(self.sonos, timeout=10)
+            except Exception as e:
+                logger.warning(f"Error checking status: {e}")
+                return True
+
+            if state == "PLAYING":
+                logger.info("✅ Audio is playing!")
+            elif state == "STOPPED":
+                logger.warning("Playback stopped")
+                return False
 
             return True
 
@@ -297,7 +408,10 @@ class TurnTablerStreamer:
         """
         Wait for HTTP server to be ready.
 
-        Polls the stream endpoint until it responds or timeout occurs.
+        Polls the server port until it accepts a connection or timeout
+        occurs. The poll interval starts at 5ms and backs off to 50ms, since
+        uvicorn usually binds within a few tens of milliseconds. One
+        non-blocking socket is reused for every attempt.
 
         Args:
             timeout: Maximum seconds to wait
@@ -305,37 +419,76 @@ class TurnTablerStreamer:
         Returns:
             True if server is ready, False if timeout
         """
-        start = time.time()
+        start = time.monotonic()
         local_ip = self.get_local_ip()
         server_addr = (local_ip, self.port)
+        delay = 0.005
 
         logger.info("Waiting for HTTP server to be ready...")
 
-        while time.time() - start < timeout:
-            try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.setblocking(False)
+
+            while time.monotonic() - start < timeout:
                 # Try to connect to the server port
-                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                s.settimeout(1)
-                result = s.connect_ex(server_addr)
-                s.close()
+                err = sock.connect_ex(server_addr)
+                if err in (errno.EINPROGRESS, errno.EALREADY):
+                    _, writable, _ = select.select([], [sock], [], 0.05)
+                    if writable:
+                        err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
 
-                if result == 0:
+                if err in (0, errno.EISCONN):
                     logger.info("✅ HTTP server is ready")
                     return True
-            except Exception:
-                pass
 
-            time.sleep(0.2)
+                time.sleep(delay)
+                delay = min(delay * 1.5, 0.05)
 
         logger.error(f"HTTP server failed to start within {timeout}s")
         return False
 
-    def start_http_server_background(self) -> bool:
+    def _create_listen_socket(self, coalesce_bytes: int) -> socket.socket:
         """
-        Start HTTP server in background thread.
+        Bind the server socket with send buffers sized for streaming.
+
+        Accepted connections inherit these options. A send buffer of about
+        two coalesced writes, plus TCP_NOTSENT_LOWAT, keeps the kernel from
+        queueing seconds of audio per client while the pipe stays full.
+
+        Args:
+            coalesce_bytes: Largest single write the stream server makes
 
         Returns:
-            True if server thread started successfully
+            Bound (not yet listening) socket for uvicorn
+        """
+        # Take the address family from --host so IPv6 binds (e.g. "::") work
+        family, _, _, _, sockaddr = socket.getaddrinfo(
+            self.host, self.port, type=socket.SOCK_STREAM, flags=socket.AI_PASSIVE
+        )[0]
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, coalesce_bytes * 2)
+        # Defined by the socket module only on platforms that have it (Linux,
+        # macOS); skipped elsewhere rather than guessing the option number
+        if hasattr(socket, "TCP_NOTSENT_LOWAT"):
+            try:
+                sock.setsockopt(
+                    socket.IPPROTO_TCP, socket.TCP_NOTSENT_LOWAT, coalesce_bytes
+                )
+            except OSError as e:
+                logger.debug(f"TCP_NOTSENT_LOWAT rejected by kernel: {e}")
+        sock.bind(sockaddr)
+        return sock
+
+    async def start_http_server(self) -> bool:
+        """
+        Start HTTP server as a task on the running event loop.
+
+        The server shares the loop with monitor_streaming, so there is a
+        single event loop and no server thread.
+
+        Returns:
+            True if server started and is accepting connections
         """
         if not self.server:
             logger.error("Server not initialized")
@@ -344,75 +497,184 @@ class TurnTablerStreamer:
         # Create FastAPI app
         app = self.server.app
 
-        config = uvicorn.Config(app, host=self.host, port=self.port, log_level="info")
-        server = uvicorn.Server(config)
+        # httptools parser (ships with fastapi[standard]); the uvloop event
+        # loop comes from run(). Single process only: extra workers would
+        # each open the USB device. Server lifecycle is logged here, so
+        # uvicorn only reports problems.
+        config = uvicorn.Config(
+            app,
+            host=self.host,
+            port=self.port,
+            log_level="warning",
+            access_log=False,
+            http="httptools",
+            interface="asgi3",
+        )
+        # Config() has just applied uvicorn's logging setup; silence any
+        # residual per-request logging on the long-lived stream
+        logging.getLogger("uvicorn.access").disabled = True
 
-        # Run in background thread
-        thread = threading.Thread(target=server.run, daemon=True)
-        thread.start()
+        loop = asyncio.get_running_loop()
+        self._http_server = _StreamServer(
+            config, on_exit=lambda: loop.call_soon_threadsafe(self._on_interrupt)
+        )
+        sock = self._create_listen_socket(self.server.coalesce_bytes)
+        self._server_task = asyncio.create_task(
+            self._http_server.serve(sockets=[sock])
+        )
 
         logger.info(f"Streaming server started on {self.host}:{self.port}")
 
-        # Wait for server to be ready
-        return self._wait_for_server_ready(timeout=5)
+        # Wait for server to be ready (probe runs in a thread so the loop
+        # is free to accept the probe connection)
+        return await asyncio.to_thread(self._wait_for_server_ready, 5)
+
+    async def stop_http_server(self, timeout: float = 5.0):
+        """
+        Shut down the HTTP server task.
+
+        Stop the producer first: that ends every open stream response, so
+        the server doesn't wait on the long-lived Sonos connection.
+
+        Args:
+            timeout: Seconds to wait for a graceful shutdown before forcing it
+        """
+        if not self._server_task:
+            return
+
+        self._http_server.should_exit = True
+        done, _ = await asyncio.wait({self._server_task}, timeout=timeout)
+        if not done:
+            logger.warning("HTTP server slow to shut down - forcing exit")
+            self._http_server.force_exit = True
+            await self._server_task
+        self._server_task = None
+
+    def _on_interrupt(self):
+        """Handle Ctrl+C/SIGTERM while the HTTP server owns signal handling."""
+        logger.info("\nStopped by user")
+        self.request_stop()
+
+    async def _log_status(self, message: str):
+        """
+        Log a periodic status line and the current Sonos transport state.
+
+        The transport query is a blocking SOAP request, so it runs in a
+        worker thread instead of on the event loop.
+
+        Args:
+            message: Status line to log before the Sonos state
+        """
+        logger.info(message)
 
-    def monitor_streaming(self) -> None:
-        """Monitor streaming and update status."""
+        if self.sonos:
+            try:
+                info = await asyncio.to_thread(self.sonos.get_current_transport_info)
+                logger.info(
+                    f"  Sonos state ({self._sonos_name}): "
+                    f"{info['current_transport_state']}"
+                )
+            except Exception as e:
+                logger.warning(f"  Error checking Sonos: {e}")
+
+    async def monitor_streaming(self) -> None:
+        """
+        Monitor streaming and update status.
+
+        Sleeps until the next status line, diagnostics summary or the end of
+        the test duration (whichever is first), or until stop is requested,
+        rather than waking every second to check.
+        """
         # Keep running until test duration expires or stop requested
         self.start_time = time.time()
+        duration = self.test_duration_seconds
+        next_status = self.STATUS_INTERVAL
 
         try:
-            while not self.stop_requested:
+            while True:
                 elapsed = time.time() - self.start_time
 
                 # Check if duration limit reached
-                if self.test_duration_seconds is not None:
-                    remaining = self.test_duration_seconds - elapsed
-
-                    if remaining <= 0:
-                        logger.info("Test duration complete")
-                        break
-
-                    # Log status periodically
-                    if int(elapsed) % 60 == 0 and int(elapsed) > 0:
-                        logger.info(
+                if duration is not None and elapsed >= duration:
+                    logger.info("Test duration complete")
+                    break
+
+                # Log status periodically
+                if elapsed >= next_status:
+                    if duration is not None:
+                        await self._log_status(
                             f"Streaming active: {int(elapsed)}s elapsed, "
-                            f"{int(remaining)}s remaining"
+                            f"{int(duration - elapsed)}s remaining"
                         )
-
-                        # Check Sonos status
-                        if self.sonos:
-                            try:
-                                state = self.sonos.get_current_transport_info()[
-                                    "current_transport_state"
-                                ]
-                                logger.info(f"  Sonos state: {state}")
-                            except Exception as e:
-                                logger.warning(f"  Error checking Sonos: {e}")
-                else:
-                    # Indefinite streaming - log periodically
-                    if int(elapsed) % 60 == 0 and int(elapsed) > 0:
-                        logger.info(f"Streaming active: {int(elapsed)}s elapsed")
-
-                        if self.sonos:
-                            try:
-                                state = self.sonos.get_current_transport_info()[
-                                    "current_transport_state"
-                                ]
-                                logger.info(f"  Sonos state: {state}")
-                            except Exception as e:
-                                logger.warning(f"  Error checking Sonos: {e}")
+                    else:
+                        await self._log_status(
+                            f"Streaming active: {int(elapsed)}s elapsed"
+                        )
+                    while next_status <= elapsed:
+                        next_status += self.STATUS_INTERVAL
 
                 # Print diagnostics summary if enabled
                 if self.diagnostics and self.diagnostics.should_print_summary():
-                    logger.info(self.diagnostics.periodic_summary())
+                    summary = self.diagnostics.periodic_summary()
+                    if summary:
+                        logger.info(summary)
 
-                time.sleep(1)
+                # Sleep until the next scheduled action
+                elapsed = time.time() - self.start_time
+                timeout = next_status - elapsed
+                if duration is not None:
+                    timeout = min(timeout, duration - elapsed)
+                if self.diagnostics:
+                    timeout = min(timeout, self.diagnostics.seconds_until_summary())
 
-        except KeyboardInterrupt:
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), timeout=max(timeout, 0)
+                    )
+                    break  # Stop requested
+                except TimeoutError:
+                    pass
+
+        except asyncio.CancelledError:
+            # Cancelled by asyncio.run() on Ctrl+C when the HTTP server isn't
+            # handling signals; it raises KeyboardInterrupt to the caller
             logger.info("\nStreaming interrupted by user")
+            raise
         finally:
-            self.stop_requested = True
+            self._stop_event.set()
+
+    def _stop_sonos(self) -> bool:
+        """
+        Stop Sonos playback, waiting at most SONOS_STOP_TIMEOUT.
+
+        The SOAP call runs on a daemon thread rather than an executor, so
+        a slow or unreachable speaker can't hold up loop or interpreter
+        shutdown once the wait gives up.
+
+        Returns:
+            True if the stop completed in time
+
+        Raises:
+            Exception: Whatever sonos.stop() raised
+        """
+        failures: list[Exception] = []
+
+        def stop():
+            try:
+                self.sonos.stop()
+            except Exception as e:
+                failures.append(e)
+
+        thread = threading.Thread(target=stop, name="sonos-stop", daemon=True)
+        thread.start()
+        thread.join(self.SONOS_STOP_TIMEOUT)
+        if failures:
+            raise failures[0]
+        return not thread.is_alive()
+
+    def request_stop(self):
+        """Ask monitor_streaming to return (call from the event loop thread)."""
+        self._stop_event.set()
 
     def run(
         self, audio_source: str = "synthetic", device: Optional[str] = None
@@ -420,6 +682,26 @@ class TurnTablerStreamer:
         """
         Run complete streaming session.
 
+        Args:
+            audio_source: Audio source type ('synthetic', 'file:<path>', or 'usb')
+            device: ALSA device for USB source (optional, auto-detects if None)
+
+        Returns:
+            StreamingStats with session information
+        """
+        return asyncio.run(
+            self._run_async(audio_source, device), loop_factory=uvloop.new_event_loop
+        )
+
+    async def _run_async(
+        self, audio_source: str, device: Optional[str]
+    ) -> StreamingStats:
+        """
+        Run the streaming session on the event loop shared with the server.
+
+        Blocking steps (device I/O, SOAP calls, thread joins) run through
+        asyncio.to_thread so the server keeps serving while they wait.
+
         Args:
             audio_source: Audio source type ('synthetic', 'file:<path>', or 'usb')
             device: ALSA device for USB source (optional, auto-detects if None)
@@ -444,13 +726,20 @@ class TurnTablerStreamer:
         final_state = "UNKNOWN"
 
         # Setup
-        if not self.setup_audio_source(audio_source, device=device):
+        if not await asyncio.to_thread(
+            self.setup_audio_source, audio_source, device=device
+        ):
             return StreamingStats(
                 duration_seconds=0,
                 final_state="SETUP_FAILED",
                 errors=["Audio source setup failed"],
             )
 
+        # Connect to Sonos in the background while the server starts; SSDP
+        # discovery alone can take up to 5s. Sonos isn't told to play until
+        # the server is ready and the buffer is full (below).
+        sonos_task = asyncio.create_task(asyncio.to_thread(self.setup_sonos))
+
         if not self.setup_streaming_server():
             return StreamingStats(
                 duration_seconds=0,
@@ -460,7 +749,7 @@ class TurnTablerStreamer:
 
         # CRITICAL: Start HTTP server FIRST, before telling Sonos to connect
         # This prevents race condition where Sonos tries to fetch stream before server is ready
-        if not self.start_http_server_background():
+        if not await self.start_http_server():
             logger.error("HTTP server failed to start")
             return StreamingStats(
                 duration_seconds=0,
@@ -478,17 +767,22 @@ class TurnTablerStreamer:
                 errors=["Audio producer failed to start"],
             )
 
-        if not self.server.prefill_buffer(timeout=5.0):
+        if not await asyncio.to_thread(self.server.prefill_buffer, timeout=5.0):
             logger.warning("Buffer pre-fill timeout - continuing anyway")
             errors.append("Buffer pre-fill timeout")
 
-        # Now setup Sonos (after server is ready)
-        if not self.setup_sonos():
+        # Wait for Sonos setup to finish
+        try:
+            sonos_ready = await sonos_task
+        except Exception as e:
+            logger.error(f"Sonos setup error: {e}")
+            sonos_ready = False
+        if not sonos_ready:
             logger.warning("Sonos setup failed - continuing with server only")
             errors.append("Sonos setup failed")
 
         # Now tell Sonos to start streaming (server is already running, buffer is full)
-        if not self.start_streaming():
+        if not await asyncio.to_thread(self.start_streaming):
             logger.warning("Sonos streaming failed - continuing with server")
             errors.append("Sonos streaming failed")
 
@@ -499,15 +793,12 @@ class TurnTablerStreamer:
             logger.info("\nStreaming indefinitely...")
         logger.info("Press Ctrl+C to stop\n")
 
-        try:
-            self.monitor_streaming()
-        except KeyboardInterrupt:
-            logger.info("\nStopped by user")
+        await self.monitor_streaming()
 
         # Get final state
         if self.sonos:
             try:
-                info = self.sonos.get_current_transport_info()
+                info = await asyncio.to_thread(self.sonos.get_current_transport_info)
                 final_state = info.get("current_transport_state", "UNKNOWN")
             except Exception:
                 final_state = "UNKNOWN"
@@ -515,15 +806,24 @@ class TurnTablerStreamer:
         # Cleanup
         if self.sonos:
             try:
-                self.sonos.stop()
-                logger.info("Stopped playback on Sonos")
+                # Bounded so Ctrl+C returns promptly even if Sonos is slow
+                if await asyncio.to_thread(self._stop_sonos):
+                    logger.info(f"Stopped playback on {self._sonos_name}")
+                else:
+                    logger.warning(
+                        f"Sonos stop not confirmed within {self.SONOS_STOP_TIMEOUT}s "
+                        f"- continuing shutdown"
+                    )
+                    errors.append("Stop timed out")
             except Exception as e:
                 logger.warning(f"Error stopping Sonos: {e}")
                 errors.append(f"Stop failed: {e}")
 
-        # Stop producer thread
+        # Stop producer thread, then the HTTP server (producer first, so
+        # open streams end and the server can shut down)
         if self.server:
-            self.server.stop_producer()
+            await asyncio.to_thread(self.server.stop_producer)
+        await self.stop_http_server()
 
         if self.audio_source:
             self.audio_source.close()
@@ -15,14 +15,23 @@ import time
 from collections import deque
 from typing import Any, AsyncGenerator, Optional
 
-from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
 
 from turntabler.audio_source import AudioFormat
 from turntabler.diagnostics import StreamingDiagnostics
 
 logger = logging.getLogger(__name__)
 
+# 44-byte PCM WAV header; generate_wav_header fills in the size and format
+# fields (offsets 4, 22-35 and 40)
+_WAV_TEMPLATE = bytearray(
+    b"RIFF" + bytes(4) + b"WAVE"
+    + b"fmt " + struct.pack("<IH", 16, 1) + bytes(14)  # PCM, 16-byte fmt chunk
+    + b"data" + bytes(4)
+)
+
 
 def generate_wav_header(wav_format: AudioFormat, infinite: bool = True) -> bytes:
     """
@@ -38,28 +47,108 @@ def generate_wav_header(wav_format: AudioFormat, infinite: bool = True) -> bytes
     # Use maximum value for infinite streams
     data_size = 0xFFFFFFFF if infinite else 0
 
-    header = b""
+    header = _WAV_TEMPLATE[:]
+    struct.pack_into("<I", header, 4, data_size)  # File size - 8
+    struct.pack_into(
+        "<HIIHH",
+        header,
+        22,
+        wav_format.channels,
+        wav_format.sample_rate,
+        wav_format.byte_rate,
+        wav_format.block_align,
+        wav_format.bits_per_sample,
+    )
+    struct.pack_into("<I", header, 40, data_size)  # Data size
+
+    return bytes(header)
+
+
+class WAVStreamEndpoint:
+    """
+    Raw ASGI app for the /stream.wav endpoint.
+
+    The stream is one long-lived response, so it is served directly with
+    ASGI messages rather than through FastAPI's request parsing, dependency
+    resolution and StreamingResponse wrapper. Response headers are encoded
+    once at construction.
+    """
+
+    def __init__(self, server: "WAVStreamingServer"):
+        """
+        Initialize stream endpoint.
+
+        Args:
+            server: Streaming server providing the audio generator
+        """
+        self.server = server
+        self.headers = [
+            (b"content-type", b"audio/wav"),
+            (b"icy-name", server.stream_name.encode("latin-1", errors="replace")),
+            (b"cache-control", b"no-cache, no-store"),
+            # Chunked encoding (no Content-Length header)
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Serve continuous WAV stream with infinite header."""
+        client = scope.get("client")
+        client_addr = client[0] if client else "unknown"
+        logger.info(f"Stream request from {client_addr}")
+
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": self.headers}
+        )
+
+        if scope["method"] == "HEAD":
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
 
-    # RIFF header
-    header += b"RIFF"
-    header += struct.pack("<I", data_size)  # File size - 8
-    header += b"WAVE"
+        # Stream until the generator ends or the client disconnects
+        sender = asyncio.create_task(self._send_stream(send))
+        listener = asyncio.create_task(self._wait_for_disconnect(receive))
+        done, _ = await asyncio.wait(
+            {sender, listener}, return_when=asyncio.FIRST_COMPLETED
+        )
+        sender.cancel()
+        listener.cancel()
+        await asyncio.gather(sender, listener, return_exceptions=True)
+
+        if sender in done and not sender.cancelled() and sender.exception():
+            raise sender.exception()
+
+    async def _send_stream(self, send: Send) -> None:
+        """
+        Send generator output as ASGI body messages.
 
-    # fmt chunk
-    header += b"fmt "
-    header += struct.pack("<I", 16)  # fmt chunk size (PCM)
-    header += struct.pack("<H", 1)  # Audio format (1 = PCM)
-    header += struct.pack("<H", wav_format.channels)
-    header += struct.pack("<I", wav_format.sample_rate)
-    header += struct.pack("<I", wav_format.byte_rate)
-    header += struct.pack("<H", wav_format.block_align)
-    header += struct.pack("<H", wav_format.bits_per_sample)
+        The WAV header is held back and sent in the same write as the first
+        audio chunk, so the client gets a playable first segment at once
+        instead of a lone 44-byte packet.
+        """
+        stream = self.server._generate_stream()
+        try:
+            pending = await anext(stream, b"")  # WAV header
+            async for chunk in stream:
+                if pending:
+                    chunk = pending + chunk
+                    pending = b""
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": True}
+                )
+            if pending:
+                await send(
+                    {"type": "http.response.body", "body": pending, "more_body": True}
+                )
+        finally:
+            await stream.aclose()
 
-    # data chunk
-    header += b"data"
-    header += struct.pack("<I", data_size)  # Data size
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
 
-    return header
+    async def _wait_for_disconnect(self, receive: Receive) -> None:
+        """Wait until the client goes away."""
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
 
 
 class WAVStreamingServer:
@@ -77,6 +166,7 @@ class WAVStreamingServer:
         stream_name: str = "TurnTabler",
         diagnostics: Optional[StreamingDiagnostics] = None,
         buffer_size: int = 12,  # ~500ms at 42.7ms per chunk
+        coalesce_bytes: int = 65536,
     ):
         """
         Initialize WAV streaming server.
@@ -87,19 +177,27 @@ class WAVStreamingServer:
             stream_name: Display name for stream
             diagnostics: Optional diagnostics collector for performance metrics
             buffer_size: Number of chunks to buffer (default 12 = ~500ms)
+            coalesce_bytes: Maximum bytes per HTTP write when several chunks
+                are already buffered (default 64 KiB)
         """
         self.audio_source = audio_source
         self.wav_format = wav_format or AudioFormat()
         self.stream_name = stream_name
         self.diagnostics = diagnostics
         self.buffer_size = buffer_size
-
-        # Producer-consumer buffer
-        self._buffer: deque = deque(maxlen=buffer_size * 2)  # Allow some headroom
-        self._buffer_lock = threading.Lock()
+        self.coalesce_bytes = coalesce_bytes
+
+        # Single producer fanning out to one queue per connected client.
+        # _buffer holds the most recent chunks (pre-fill, and the backlog a
+        # new client starts with); each subscriber queue is bounded and
+        # drops its oldest chunk if that client falls behind.
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._subscribers: list[deque] = []
+        self._buffer_cond = threading.Condition()
         self._producer_thread: Optional[threading.Thread] = None
         self._stop_producer = threading.Event()
         self._buffer_ready = threading.Event()
+        self._drops = 0  # Oldest chunks discarded from lagging client queues
 
         self.app = FastAPI(title="TurnTabler WAV Streaming Server")
         self._setup_routes()
@@ -139,6 +237,8 @@ class WAVStreamingServer:
     def stop_producer(self):
         """Stop the producer thread."""
         self._stop_producer.set()
+        with self._buffer_cond:
+            self._buffer_cond.notify_all()
         if self._producer_thread:
             self._producer_thread.join(timeout=2.0)
             logger.info("Stopped audio producer thread")
@@ -146,6 +246,11 @@ class WAVStreamingServer:
     def _producer_loop(self):
         """Producer thread loop - reads audio and fills buffer."""
         logger.info("Producer loop started")
+        drops_logged = 0
+        last_drop_log = 0.0
+        # Unpaced sources (synthetic, file) outrun every real-time client,
+        # so their drops are expected and only worth a debug line
+        log_drops = logger.warning if self.audio_source.realtime else logger.debug
 
         while not self._stop_producer.is_set():
             # Read chunk from audio source
@@ -156,10 +261,29 @@ class WAVStreamingServer:
                 logger.info("Audio source exhausted in producer")
                 break
 
-            # Add to buffer
-            with self._buffer_lock:
+            # Add to backlog and every client queue, then wake the consumers
+            with self._buffer_cond:
                 self._buffer.append(chunk)
                 buffer_len = len(self._buffer)
+                for queue in self._subscribers:
+                    if len(queue) == queue.maxlen:
+                        # Full: append drops the oldest chunk so the client
+                        # stays near live rather than falling further behind
+                        self._drops += 1
+                    queue.append(chunk)
+                self._buffer_cond.notify_all()
+                drops = self._drops
+
+            # Report drops at most once per second
+            if drops != drops_logged:
+                now = time.monotonic()
+                if now - last_drop_log >= 1.0:
+                    log_drops(
+                        f"Client falling behind - dropped {drops - drops_logged} "
+                        f"oldest chunk(s) ({drops} total)"
+                    )
+                    drops_logged = drops
+                    last_drop_log = now
 
             # Signal that buffer has data (for initial pre-fill)
             if buffer_len >= self.buffer_size and not self._buffer_ready.is_set():
@@ -186,7 +310,7 @@ class WAVStreamingServer:
 
         logger.info(f"Waiting for buffer to fill ({self.buffer_size} chunks)...")
         if self._buffer_ready.wait(timeout=timeout):
-            with self._buffer_lock:
+            with self._buffer_cond:
                 logger.info(f"Buffer ready with {len(self._buffer)} chunks")
             return True
         else:
@@ -211,115 +335,207 @@ class WAVStreamingServer:
                 "stream_name": self.stream_name,
             }
 
-        @self.app.get("/stream.wav")
-        async def stream_wav(request: Request):
-            """
-            WAV streaming endpoint.
-
-            Returns continuous WAV stream with infinite header.
-            """
-            client_addr = request.client.host if request.client else "unknown"
-            logger.info(f"Stream request from {client_addr}")
-
-            return StreamingResponse(
-                self._generate_stream(),
-                media_type="audio/wav",
-                headers={
-                    "icy-name": self.stream_name,
-                    "Cache-Control": "no-cache, no-store",
-                    # Chunked encoding (no Content-Length header)
-                },
-            )
+        self.app.router.routes.append(
+            Route("/stream.wav", endpoint=WAVStreamEndpoint(self), methods=["GET"])
+        )
 
     async def _generate_stream(self) -> AsyncGenerator[bytes, None]:
         """
         Generate WAV stream.
 
+        Each call registers its own queue with the producer, so every
+        connected client receives the full stream from one capture.
+
         Yields:
             WAV header followed by continuous PCM data chunks from buffer
         """
+        queue = self._subscribe()
+
         # Send WAV header first
         header = generate_wav_header(self.wav_format, infinite=True)
         yield header
         logger.info("WAV header sent (infinite size)")
 
-        # Stream audio data from buffer
+        # Stream audio data from buffer. Per-stream constants and bound
+        # methods are resolved once here so the loop only touches locals.
+        byte_rate = self.wav_format.byte_rate
+        take_from_buffer = self._take_from_buffer
+        get_from_buffer = self._get_from_buffer
+        diagnostics = self.diagnostics
+        to_thread = asyncio.to_thread
+        sleep = asyncio.sleep
+        now = time.time
+        log = logger
+        # Chunk/byte accounting only feeds debug output, so skip it entirely
+        # unless debug logging is enabled
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
         chunk_count = 0
         total_bytes = 0
 
         try:
             while True:
-                yield_start = time.time()
+                yield_start = now()
 
-                # Get chunk from buffer
-                chunk = await asyncio.to_thread(self._get_from_buffer)
+                # Get chunk from buffer - only hop to a worker thread when
+                # the buffer is empty and we actually have to wait
+                chunk = take_from_buffer(queue)
+                if chunk is None:
+                    chunk = await to_thread(get_from_buffer, queue)
+                else:
+                    # Still give other tasks (e.g. disconnect listener) a turn
+                    await sleep(0)
 
                 if chunk is None:
-                    logger.info("Buffer exhausted - producer stopped")
+                    log.info("Buffer exhausted - producer stopped")
                     break
 
                 yield chunk
-                yield_latency_ms = (time.time() - yield_start) * 1000
+                yield_latency_ms = (now() - yield_start) * 1000
 
                 # Record diagnostics
-                if self.diagnostics:
-                    self.diagnostics.record_yield(yield_latency_ms)
-
-                chunk_count += 1
-                total_bytes += len(chunk)
-
-                # Periodic logging
-                if chunk_count % 1000 == 0:
-                    mb_sent = total_bytes / 1_000_000
-                    seconds = total_bytes / self.wav_format.byte_rate
-                    with self._buffer_lock:
-                        buf_len = len(self._buffer)
-                    logger.debug(
-                        f"Streamed {chunk_count} chunks "
-                        f"({mb_sent:.1f}MB, {seconds:.1f}s) buffer={buf_len}"
-                    )
+                if diagnostics:
+                    diagnostics.record_yield(yield_latency_ms)
+
+                if debug_enabled:
+                    chunk_count += 1
+                    total_bytes += len(chunk)
+
+                    # Periodic logging
+                    if chunk_count % 1000 == 0:
+                        mb_sent = total_bytes / 1_000_000
+                        seconds = total_bytes / byte_rate
+                        with self._buffer_cond:
+                            buf_len = len(queue)
+                        log.debug(
+                            f"Streamed {chunk_count} chunks "
+                            f"({mb_sent:.1f}MB, {seconds:.1f}s) buffer={buf_len}"
+                        )
 
         except Exception as e:
             logger.error(f"Stream error: {e}")
             raise
 
         finally:
+            self._unsubscribe(queue)
+            if debug_enabled:
+                logger.info(
+                    f"Stream ended: {chunk_count} chunks, "
+                    f"{total_bytes / 1_000_000:.1f}MB"
+                )
+            else:
+                logger.info("Stream ended")
+
+    @property
+    def drops(self) -> int:
+        """Number of oldest chunks dropped from lagging client queues."""
+        return self._drops
+
+    def _subscribe(self) -> deque:
+        """
+        Register a client queue with the producer.
+
+        The queue starts with the current backlog so the client has data
+        immediately (same effect as the pre-fill for the first client).
+
+        Returns:
+            Queue the producer will append every new chunk to
+        """
+        with self._buffer_cond:
+            queue: deque = deque(self._buffer, maxlen=self.buffer_size * 2)
+            self._subscribers.append(queue)
+            logger.info(f"Stream client subscribed ({len(self._subscribers)} active)")
+        return queue
+
+    def _unsubscribe(self, queue: deque):
+        """Remove a client queue from the producer."""
+        with self._buffer_cond:
+            # Match by identity: deques compare by value, so two drained
+            # client queues are equal and remove() could drop the wrong one
+            self._subscribers = [q for q in self._subscribers if q is not queue]
             logger.info(
-                f"Stream ended: {chunk_count} chunks, {total_bytes / 1_000_000:.1f}MB"
+                f"Stream client unsubscribed ({len(self._subscribers)} active)"
             )
 
-    def _get_from_buffer(self) -> Optional[bytes]:
+    def _get_from_buffer(self, queue: deque) -> Optional[bytes]:
         """
-        Get a chunk from the buffer, waiting if necessary.
+        Get buffered audio for one client, waiting if necessary.
+
+        Blocks on a condition variable until the producer appends data,
+        rather than polling, so the consumer wakes as soon as a chunk lands.
+
+        Args:
+            queue: Client queue from _subscribe()
 
         Returns:
-            Audio chunk bytes, or None if producer stopped and buffer empty
+            Audio bytes, or None if the producer was stopped or no data
+            arrived in time
         """
-        # Wait for data with timeout to allow checking producer status
-        max_wait = 0.01  # 10ms timeout per iteration
-        waited = 0.0
         max_total_wait = 2.0  # Give up after 2 seconds
+        stopped = self._stop_producer.is_set
 
-        while waited < max_total_wait:
-            with self._buffer_lock:
-                if self._buffer:
-                    chunk = self._buffer.popleft()
-                    buffer_len = len(self._buffer)
+        with self._buffer_cond:
+            self._buffer_cond.wait_for(
+                lambda: queue or stopped(),
+                timeout=max_total_wait,
+            )
+
+            # Once stopped, end the response without draining the queue
+            if stopped():
+                return None
+            if queue:
+                return self._pop_buffered(queue)
 
-                    # Record buffer occupancy
-                    if self.diagnostics:
-                        self.diagnostics.record_buffer_occupancy(buffer_len)
+        logger.warning(f"Buffer underrun - waited {max_total_wait:.1f}s for data")
+        return None
 
-                    return chunk
+    def _take_from_buffer(self, queue: deque) -> Optional[bytes]:
+        """
+        Get buffered audio for one client without waiting.
 
-            # Buffer empty - check if producer stopped
-            if self._stop_producer.is_set():
-                return None
+        Safe to call on the event loop: the lock is only held for a few
+        deque operations.
 
-            # Wait a bit for producer to add data
-            time.sleep(max_wait)
-            waited += max_wait
+        Args:
+            queue: Client queue from _subscribe()
 
-        # Timeout - producer might be stuck
-        logger.warning(f"Buffer underrun - waited {waited:.1f}s for data")
+        Returns:
+            Audio bytes, or None if the queue is currently empty or the
+            producer was stopped
+        """
+        with self._buffer_cond:
+            if queue and not self._stop_producer.is_set():
+                return self._pop_buffered(queue)
         return None
+
+    def _pop_buffered(self, queue: deque) -> bytes:
+        """
+        Pop the next chunk, coalescing any further buffered chunks.
+
+        Chunks already waiting are joined (up to coalesce_bytes) so a backlog
+        goes out in one HTTP write instead of one write per chunk. Never
+        waits for more data than is available. Caller must hold _buffer_cond
+        and ensure the queue is non-empty.
+
+        Args:
+            queue: Client queue from _subscribe()
+
+        Returns:
+            Audio bytes
+        """
+        chunk = queue.popleft()
+        if queue:
+            chunks = [chunk]
+            size = len(chunk)
+            limit = self.coalesce_bytes
+            while queue and size + len(queue[0]) <= limit:
+                chunk = queue.popleft()
+                chunks.append(chunk)
+                size += len(chunk)
+            chunk = b"".join(chunks)
+
+        # Record buffer occupancy
+        if self.diagnostics:
+            self.diagnostics.record_buffer_occupancy(len(queue))
+
+        return chunk
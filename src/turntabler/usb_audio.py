@@ -20,7 +20,9 @@ Typical usage:
 """
 
 import logging
+import os
 import re
+import time
 from dataclasses import dataclass
 from typing import List, Optional
 
@@ -28,6 +30,17 @@ import alsaaudio
 
 logger = logging.getLogger(__name__)
 
+# hw:CARD=CardName,DEV=N format
+HW_DEVICE_PATTERN = re.compile(r"hw:CARD=([^,]+),DEV=(\d+)")
+
+# hw:X,Y format
+HW_INDEX_PATTERN = re.compile(r"hw:(\d+),(\d+)")
+
+# Card lines in /proc/asound/cards, e.g. " 1 [CODEC          ]: USB-Audio - ..."
+PROC_CARD_PATTERN = re.compile(r"^\s*(\d+)\s+\[(\S+)\s*\]:", re.MULTILINE)
+
+PROC_ASOUND_CARDS = "/proc/asound/cards"
+
 
 @dataclass
 class AudioDevice:
@@ -50,6 +63,33 @@ class AudioDevice:
         return f"{self.card_name} ({self.device_name})"
 
 
+@dataclass(frozen=True)
+class _DeviceTable:
+    """
+    Enumerated capture devices stored column-wise (one tuple per attribute).
+
+    Filtering scans a single tuple of card names; AudioDevice objects are
+    only built for the entries handed back to callers.
+    """
+
+    device_names: tuple[str, ...] = ()
+    card_names: tuple[str, ...] = ()
+    card_numbers: tuple[int, ...] = ()
+    device_numbers: tuple[int, ...] = ()
+
+    def __len__(self) -> int:
+        return len(self.device_names)
+
+    def device(self, index: int) -> AudioDevice:
+        """Materialize the device at index."""
+        return AudioDevice(
+            device_name=self.device_names[index],
+            card_number=self.card_numbers[index],
+            card_name=self.card_names[index],
+            device_number=self.device_numbers[index],
+        )
+
+
 class USBAudioDeviceManager:
     """
     Manages USB audio device detection and enumeration.
@@ -65,11 +105,38 @@ class USBAudioDeviceManager:
     # Patterns for internal sound cards to filter out
     INTERNAL_CARD_PATTERNS = ["PCH", "Intel", "Analog", "Built-in", "HDA"]
 
+    # Each pattern list compiled into one case-insensitive alternation, so a
+    # card name is checked against all patterns in a single regex scan
+    _PREFERRED_RE = re.compile(
+        "|".join(map(re.escape, PREFERRED_DEVICE_PATTERNS)), re.IGNORECASE
+    )
+    _INTERNAL_RE = re.compile(
+        "|".join(map(re.escape, INTERNAL_CARD_PATTERNS)), re.IGNORECASE
+    )
+
+    # Priority of each preferred pattern (lower is better)
+    _PREFERRED_RANK = {p.lower(): i for i, p in enumerate(PREFERRED_DEVICE_PATTERNS)}
+
+    # Seconds an enumeration result stays valid
+    CACHE_TTL = 2.0
+
+    # (timestamp, table) from the last enumeration
+    _cache: Optional[tuple[float, _DeviceTable]] = None
+
+    # (timestamp, {card id: card number}) from the last /proc/asound read
+    _cards_cache: Optional[tuple[float, dict[str, int]]] = None
+
     @staticmethod
-    def list_capture_devices() -> List[AudioDevice]:
+    def list_capture_devices(cache_ttl: float = CACHE_TTL) -> List[AudioDevice]:
         """
         List all available ALSA capture devices.
 
+        Enumeration walks /proc/asound and opens control devices, so results
+        are cached for cache_ttl seconds. Pass cache_ttl=0 to force a rescan.
+
+        Args:
+            cache_ttl: Maximum age in seconds of a cached result to reuse
+
         Returns:
             List of AudioDevice objects representing available capture devices.
             Empty list if no devices found.
@@ -80,37 +147,55 @@ class USBAudioDeviceManager:
             >>> for dev in devices:
             ...     print(dev.card_name)
         """
-        devices = []
+        table = USBAudioDeviceManager._scan(cache_ttl)
+        return [table.device(i) for i in range(len(table))]
+
+    @staticmethod
+    def _scan(cache_ttl: float = CACHE_TTL) -> _DeviceTable:
+        """
+        Enumerate ALSA capture devices into a column-wise table.
+
+        Args:
+            cache_ttl: Maximum age in seconds of a cached result to reuse
+
+        Returns:
+            _DeviceTable of hw:CARD=...,DEV=... capture devices
+        """
+        cache = USBAudioDeviceManager._cache
+        if cache is not None and time.monotonic() - cache[0] < cache_ttl:
+            return cache[1]
 
         try:
             alsa_devices = alsaaudio.pcms(alsaaudio.PCM_CAPTURE)
         except alsaaudio.ALSAAudioError as e:
             logger.error(f"Failed to enumerate ALSA devices: {e}")
-            return devices
+            return _DeviceTable()
 
-        # Regex to parse hw:CARD=CardName,DEV=N format
-        hw_pattern = re.compile(r"hw:CARD=([^,]+),DEV=(\d+)")
+        device_names = []
+        card_names = []
+        card_numbers = []
+        device_numbers = []
 
         for dev_str in alsa_devices:
-            match = hw_pattern.match(dev_str)
+            match = HW_DEVICE_PATTERN.match(dev_str)
             if match:
-                card_name = match.group(1)
-                dev_num = int(match.group(2))
+                device_names.append(dev_str)
+                card_names.append(match.group(1))
+                device_numbers.append(int(match.group(2)))
 
                 # Extract card number if possible
-                card_num = USBAudioDeviceManager._get_card_number(dev_str)
+                card_numbers.append(USBAudioDeviceManager._get_card_number(dev_str))
 
-                devices.append(
-                    AudioDevice(
-                        device_name=dev_str,
-                        card_number=card_num,
-                        card_name=card_name,
-                        device_number=dev_num,
-                    )
-                )
+        table = _DeviceTable(
+            device_names=tuple(device_names),
+            card_names=tuple(card_names),
+            card_numbers=tuple(card_numbers),
+            device_numbers=tuple(device_numbers),
+        )
 
-        logger.debug(f"Found {len(devices)} ALSA capture device(s)")
-        return devices
+        logger.debug(f"Found {len(table)} ALSA capture device(s)")
+        USBAudioDeviceManager._cache = (time.monotonic(), table)
+        return table
 
     @staticmethod
     def _get_card_number(device_str: str) -> int:
@@ -127,15 +212,44 @@ class USBAudioDeviceManager:
             Card number (0, 1, 2, ...) or -1 if unknown
         """
         # Try to match hw:X,Y format first
-        simple_pattern = re.compile(r"hw:(\d+),(\d+)")
-        match = simple_pattern.match(device_str)
+        match = HW_INDEX_PATTERN.match(device_str)
         if match:
             return int(match.group(1))
 
-        # Could extend this to parse /proc/asound/cards if needed
-        # For now, return -1 for named devices
+        # Named devices: look the card id up in /proc/asound/cards
+        match = HW_DEVICE_PATTERN.match(device_str)
+        if match:
+            return USBAudioDeviceManager._read_card_numbers().get(match.group(1), -1)
+
         return -1
 
+    @staticmethod
+    def _read_card_numbers(cache_ttl: float = CACHE_TTL) -> dict[str, int]:
+        """
+        Map ALSA card ids to card numbers from /proc/asound/cards.
+
+        Args:
+            cache_ttl: Maximum age in seconds of a cached result to reuse
+
+        Returns:
+            Dictionary of card id (e.g., 'CODEC') to card number.
+            Empty if /proc/asound is unavailable.
+        """
+        cache = USBAudioDeviceManager._cards_cache
+        if cache is not None and time.monotonic() - cache[0] < cache_ttl:
+            return cache[1]
+
+        try:
+            with open(PROC_ASOUND_CARDS) as f:
+                text = f.read()
+        except OSError as e:
+            logger.debug(f"Cannot read {PROC_ASOUND_CARDS}: {e}")
+            text = ""
+
+        cards = {card_id: int(num) for num, card_id in PROC_CARD_PATTERN.findall(text)}
+        USBAudioDeviceManager._cards_cache = (time.monotonic(), cards)
+        return cards
+
     @staticmethod
     def find_device(pattern: Optional[str] = None) -> Optional[AudioDevice]:
         """
@@ -158,27 +272,32 @@ class USBAudioDeviceManager:
             >>> if device:
             ...     print(f"Found: {device.device_name}")
         """
-        devices = USBAudioDeviceManager.list_capture_devices()
+        table = USBAudioDeviceManager._scan()
+        card_names = table.card_names
 
         # If no explicit pattern, check for preferred devices first
         if not pattern:
-            for pref_pattern in USBAudioDeviceManager.PREFERRED_DEVICE_PATTERNS:
-                for dev in devices:
-                    if pref_pattern.lower() in dev.card_name.lower():
-                        logger.info(f"Found preferred device: {dev}")
-                        return dev
+            rank = USBAudioDeviceManager._PREFERRED_RANK
+            best = -1
+            best_rank = len(rank)
+            for i, name in enumerate(card_names):
+                matches = USBAudioDeviceManager._PREFERRED_RE.findall(name)
+                if matches:
+                    dev_rank = min(rank[m.lower()] for m in matches)
+                    if dev_rank < best_rank:
+                        best, best_rank = i, dev_rank
+            if best >= 0:
+                device = table.device(best)
+                logger.info(f"Found preferred device: {device}")
+                return device
 
         # Filter out internal sound cards
-        usb_devices = [
-            dev
-            for dev in devices
-            if not any(
-                p.lower() in dev.card_name.lower()
-                for p in USBAudioDeviceManager.INTERNAL_CARD_PATTERNS
-            )
+        internal = USBAudioDeviceManager._INTERNAL_RE
+        usb_indices = [
+            i for i, name in enumerate(card_names) if not internal.search(name)
         ]
 
-        logger.debug(f"Found {len(usb_devices)} USB audio device(s) after filtering")
+        logger.debug(f"Found {len(usb_indices)} USB audio device(s) after filtering")
 
         if pattern:
             try:
@@ -187,17 +306,18 @@ class USBAudioDeviceManager:
                 logger.error(f"Invalid regex pattern '{pattern}': {e}")
                 return None
 
-            for device in usb_devices:
-                if regex.search(device.card_name):
+            for i in usb_indices:
+                if regex.search(card_names[i]):
+                    device = table.device(i)
                     logger.info(f"Found matching device: {device}")
                     return device
 
             logger.warning(f"No device found matching pattern: {pattern}")
             return None
 
-        elif usb_devices:
+        elif usb_indices:
             # Return first USB device
-            device = usb_devices[0]
+            device = table.device(usb_indices[0])
             logger.info(f"Auto-detected USB device: {device}")
             return device
 
@@ -209,8 +329,12 @@ class USBAudioDeviceManager:
         """
         Get information about a specific device.
 
-        Attempts to open the device to verify accessibility. Returns a
-        dictionary with device status and any error information.
+        For hw: devices, resolves the capture node (/dev/snd/pcmC<card>D<dev>c)
+        via /proc/asound and checks it exists and is read/write accessible.
+        The PCM is never opened, so this is cheap and safe to call while the
+        device is capturing. Other device names (e.g., 'default') fall back
+        to opening the device briefly. Returns a dictionary with device
+        status and any error information.
 
         Args:
             device_name: ALSA device string (e.g., 'hw:1,0')
@@ -227,6 +351,37 @@ class USBAudioDeviceManager:
             >>> if info['accessible']:
             ...     print("Device is ready")
         """
+        match = HW_DEVICE_PATTERN.match(device_name) or HW_INDEX_PATTERN.match(
+            device_name
+        )
+        if match:
+            card_num = USBAudioDeviceManager._get_card_number(device_name)
+            if card_num < 0:
+                return {
+                    "device": device_name,
+                    "accessible": False,
+                    "error": f"Sound card '{match.group(1)}' not found",
+                }
+
+            node = f"/dev/snd/pcmC{card_num}D{match.group(2)}c"
+            if not os.path.exists(node):
+                return {
+                    "device": device_name,
+                    "accessible": False,
+                    "error": f"Capture device node not found: {node}",
+                }
+            if not os.access(node, os.R_OK | os.W_OK):
+                return {
+                    "device": device_name,
+                    "accessible": False,
+                    "error": f"Permission denied: {node} (add user to 'audio' group)",
+                }
+
+            return {
+                "device": device_name,
+                "accessible": True,
+            }
+
         try:
             # Open device temporarily to verify accessibility
             pcm = alsaaudio.PCM(
@@ -30,10 +30,13 @@ Typical usage:
 """
 
 import logging
+import errno
+import math
+import os
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Generator, Optional
+from typing import BinaryIO, Callable, Generator, Optional, Union
 
 import alsaaudio
 
@@ -60,7 +63,25 @@ class SampleFormat(Enum):
     S32_LE = alsaaudio.PCM_FORMAT_S32_LE  # 32-bit signed little-endian
 
 
-@dataclass
+# Container size of each format in bytes
+_BYTES_PER_SAMPLE = {
+    SampleFormat.S16_LE: 2,
+    SampleFormat.S24_3LE: 3,
+    SampleFormat.S32_LE: 4,
+}
+
+# Bit depth of each format
+_BIT_DEPTH = {
+    SampleFormat.S16_LE: 16,
+    SampleFormat.S24_3LE: 24,
+    SampleFormat.S32_LE: 32,
+}
+
+# Most buffers a single writev() call accepts (more fails with EINVAL)
+_IOV_MAX = os.sysconf("SC_IOV_MAX")
+
+
+@dataclass(slots=True)
 class CaptureConfig:
     """
     Configuration for audio capture.
@@ -77,6 +98,14 @@ class CaptureConfig:
         period_size: Frames per period. Affects latency and reliability.
                     1024 recommended for USB audio (balance of latency/reliability)
         periods: Number of periods in buffer. 3 recommended for USB devices.
+        prefer_aligned: Capture S24_3LE as S32_LE instead, so samples are
+                    aligned 4-byte words. Requires hardware S32_LE support.
+        shift_right_8: Set when prefer_aligned substituted S32_LE. Samples
+                    are then MSB-justified; shift right by 8 for the 24-bit
+                    value (raw files need the same shift to match S24).
+
+    Derived sizes (bytes_per_sample, period_bytes, ...) are computed once at
+    construction, so create a new config rather than changing fields.
 
     Example:
         >>> config = CaptureConfig(
@@ -94,6 +123,25 @@ class CaptureConfig:
     sample_format: SampleFormat = SampleFormat.S16_LE
     period_size: int = 1024
     periods: int = 3
+    prefer_aligned: bool = False
+    shift_right_8: bool = field(init=False, default=False)
+
+    # Derived sizes, set in __post_init__
+    _bytes_per_sample: int = field(init=False, repr=False, compare=False)
+    _bytes_per_frame: int = field(init=False, repr=False, compare=False)
+    _period_bytes: int = field(init=False, repr=False, compare=False)
+    _bit_depth: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Precompute derived sizes; they are read on every captured period."""
+        if self.prefer_aligned and self.sample_format == SampleFormat.S24_3LE:
+            # Misaligned 3-byte samples -> 24-bit in a 32-bit container
+            self.sample_format = SampleFormat.S32_LE
+            self.shift_right_8 = True
+        self._bytes_per_sample = _BYTES_PER_SAMPLE.get(self.sample_format, 2)
+        self._bytes_per_frame = self._bytes_per_sample * self.channels
+        self._period_bytes = self._bytes_per_frame * self.period_size
+        self._bit_depth = _BIT_DEPTH.get(self.sample_format, 16)
 
     @property
     def latency_ms(self) -> float:
@@ -121,13 +169,7 @@ class CaptureConfig:
         Returns:
             Number of bytes per sample (2 for 16-bit, 3 for 24-bit, 4 for 32-bit)
         """
-        if self.sample_format == SampleFormat.S16_LE:
-            return 2
-        elif self.sample_format == SampleFormat.S24_3LE:
-            return 3
-        elif self.sample_format == SampleFormat.S32_LE:
-            return 4
-        return 2  # default
+        return self._bytes_per_sample
 
     @property
     def bytes_per_frame(self) -> int:
@@ -139,7 +181,7 @@ class CaptureConfig:
         Returns:
             bytes_per_sample * channels
         """
-        return self.bytes_per_sample * self.channels
+        return self._bytes_per_frame
 
     @property
     def period_bytes(self) -> int:
@@ -149,7 +191,7 @@ class CaptureConfig:
         Returns:
             Number of bytes expected in each captured period
         """
-        return self.period_size * self.bytes_per_frame
+        return self._period_bytes
 
     @property
     def bit_depth(self) -> int:
@@ -159,13 +201,7 @@ class CaptureConfig:
         Returns:
             Bit depth (16, 24, or 32)
         """
-        if self.sample_format == SampleFormat.S16_LE:
-            return 16
-        elif self.sample_format == SampleFormat.S24_3LE:
-            return 24
-        elif self.sample_format == SampleFormat.S32_LE:
-            return 32
-        return 16  # default
+        return self._bit_depth
 
     def __str__(self) -> str:
         """String representation of configuration."""
@@ -183,6 +219,107 @@ class CaptureError(Exception):
     pass
 
 
+def convert_to_s16(data: bytes, sample_format: SampleFormat, out: bytearray) -> int:
+    """
+    Convert captured PCM samples to 16-bit signed little-endian.
+
+    Keeps the two most significant bytes of each little-endian sample
+    (truncation, no dither). The copy is done with strided slice assignment,
+    which runs as a C-level loop with no per-sample Python overhead.
+
+    Args:
+        data: Raw PCM data in sample_format
+        sample_format: Format of data (S16_LE, S24_3LE or S32_LE)
+        out: Reusable output buffer, grown as needed
+
+    Returns:
+        Number of valid bytes written to the start of out
+    """
+    width = _BYTES_PER_SAMPLE.get(sample_format, 2)
+    if width == 2:
+        out[: len(data)] = data
+        return len(data)
+
+    samples = len(data) // width
+    size = samples * 2
+    if len(out) < size:
+        out.extend(bytes(size - len(out)))
+
+    src = memoryview(data)[: samples * width]
+    dst = memoryview(out)[:size]
+    dst[0::2] = src[width - 2 :: width]
+    dst[1::2] = src[width - 1 :: width]
+    return size
+
+
+def sample_view(
+    data: bytes, sample_format: SampleFormat, channels: int = 2
+) -> memoryview:
+    """
+    View captured PCM data as samples without copying.
+
+    S16_LE and S32_LE are cast to a 2-D (frames, channels) memoryview of
+    signed integers, so view[frame, channel] reads one sample in place.
+    S24_3LE has no native 3-byte type and is returned as a (frames, channels
+    * 3) byte view. Uses native byte order, which is little-endian on the
+    Raspberry Pi and x86 hosts this runs on.
+
+    Args:
+        data: Raw PCM data in sample_format (e.g. a chunk from capture_stream)
+        sample_format: Format of data
+        channels: Number of interleaved channels
+
+    Returns:
+        Zero-copy memoryview over data
+
+    Example:
+        >>> view = sample_view(chunk, SampleFormat.S16_LE, channels=2)
+        >>> left, right = view[0, 0], view[0, 1]
+    """
+    width = _BYTES_PER_SAMPLE.get(sample_format, 2)
+    frames = len(data) // (width * channels)
+    view = memoryview(data)[: frames * width * channels]
+    if width == 2:
+        return view.cast("h", (frames, channels))
+    if width == 4:
+        return view.cast("i", (frames, channels))
+    return view.cast("B", (frames, channels * width))
+
+
+def _writev_all(fd: int, buffers: list) -> int:
+    """
+    Write every buffer to fd with writev(), resuming after short writes.
+
+    Pipes and sockets may accept only part of a gathered write; the rest
+    is retried from where the kernel stopped. Each call passes at most
+    IOV_MAX buffers.
+
+    Args:
+        fd: Open file descriptor
+        buffers: Bytes-like objects to write in order
+
+    Returns:
+        Number of bytes written (always the total size of buffers)
+
+    Raises:
+        OSError: If the write fails or writev() makes no progress
+    """
+    views = [view for b in buffers if (view := memoryview(b).cast("B"))]
+    total = sum(len(v) for v in views)
+    first = 0  # Index of the first view not fully written
+    while first < len(views):
+        written = os.writev(fd, views[first : first + _IOV_MAX])
+        if written == 0:
+            raise OSError(errno.EIO, f"writev() wrote 0 of {total} bytes")
+        # Skip fully written buffers and trim the partially written one
+        while first < len(views) and written >= len(views[first]):
+            written -= len(views[first])
+            first += 1
+        if written:
+            views[first] = views[first][written:]
+    return total
+
+
 class USBAudioCapture:
     """
     USB Audio capture using ALSA.
@@ -202,10 +339,17 @@ class USBAudioCapture:
         ...         capture.close()
     """
 
+    # Adaptive buffer sizing (see adaptive_periods)
+    MAX_PERIODS = 8
+    GROW_WINDOW_SECONDS = 5.0  # Window for measuring the overrun rate
+    GROW_OVERRUN_RATE = 0.1  # Overruns/sec that trigger one more period
+    SHRINK_STABLE_SECONDS = 30.0  # Overrun-free time before one fewer period
+
     def __init__(
         self,
         config: CaptureConfig,
         diagnostics: Optional[StreamingDiagnostics] = None,
+        adaptive_periods: bool = False,
     ):
         """
         Initialize USB audio capture.
@@ -213,13 +357,20 @@ class USBAudioCapture:
         Args:
             config: CaptureConfig object with capture parameters
             diagnostics: Optional diagnostics collector for performance metrics
+            adaptive_periods: Grow the ALSA buffer by one period (reopening
+                     the device) when overruns exceed GROW_OVERRUN_RATE, up to
+                     MAX_PERIODS, and shrink back one step at a time after
+                     SHRINK_STABLE_SECONDS without overruns. Never goes below
+                     config.periods.
         """
         self.config = config
         self.diagnostics = diagnostics
+        self.adaptive_periods = adaptive_periods
         self.pcm: Optional[alsaaudio.PCM] = None
         self.is_capturing = False
         self._frames_captured = 0
         self._overruns = 0
+        self._min_periods = config.periods
 
         logger.info(f"USB Audio Capture initialized: {config}")
 
@@ -239,6 +390,11 @@ class USBAudioCapture:
             ...     print("Failed to open device")
         """
         try:
+            # Read/write access is deliberate: pyalsaaudio does not expose
+            # mmap access or its snd_pcm_t handle, so a ctypes mmap path would
+            # need a second, separately opened PCM. At 48kHz stereo S16 the
+            # per-period copy in read() is ~190KB/s, well under the cost of
+            # the HTTP path, so the extra libasound binding isn't worth it.
             self.pcm = alsaaudio.PCM(
                 type=alsaaudio.PCM_CAPTURE,
                 mode=alsaaudio.PCM_NORMAL,
@@ -246,10 +402,14 @@ class USBAudioCapture:
                 channels=self.config.channels,
                 format=self.config.sample_format.value,
                 periodsize=self.config.period_size,
+                periods=self.config.periods,
                 device=self.config.device,
             )
 
-            logger.info(f"Opened ALSA device: {self.config.device}")
+            logger.info(
+                f"Opened ALSA device: {self.config.device} "
+                f"({self.config.periods} periods)"
+            )
             return True
 
         except alsaaudio.ALSAAudioError as e:
@@ -290,6 +450,12 @@ class USBAudioCapture:
         the device. Each chunk contains approximately period_size frames
         of audio data.
 
+        Reads happen on the consuming thread, so a slow consumer or callback
+        delays the next read and can overrun the ALSA buffer. For streaming,
+        WAVStreamingServer already drains this generator from a dedicated
+        producer thread into a bounded buffer; other long-running consumers
+        should do the same rather than process chunks inline.
+
         Args:
             callback: Optional callback function called with each audio chunk.
                      Useful for processing audio while capturing (e.g., writing to file)
@@ -314,9 +480,35 @@ class USBAudioCapture:
             raise CaptureError("Device not opened. Call open() first.")
 
         self.is_capturing = True
-        start_time = time.time()
+        start_time = time.monotonic()
         self._frames_captured = 0
         self._overruns = 0
+        # Duration limit as a frame count, so the loop compares integers
+        # instead of reading the clock every period (inf when unbounded, so
+        # there is a single comparison either way)
+        deadline_frames = (
+            int(duration_seconds * self.config.sample_rate)
+            if duration_seconds
+            else math.inf
+        )
+
+        # Bind per-period lookups to locals once
+        read = self.pcm.read
+        diagnostics = self.diagnostics
+        perf_counter = time.perf_counter
+        epipe = -alsaaudio.EPIPE
+        overruns_logged = 0
+        last_overrun_log = 0.0
+
+        # Adaptive periods: measured in captured frames, not wall time
+        adaptive = self.adaptive_periods
+        rate = self.config.sample_rate
+        window_frames = int(self.GROW_WINDOW_SECONDS * rate)
+        stable_frames = int(self.SHRINK_STABLE_SECONDS * rate)
+        grow_overruns = self.GROW_OVERRUN_RATE * self.GROW_WINDOW_SECONDS
+        window_end = window_frames
+        window_start_overruns = 0
+        last_overrun_frame = 0
 
         logger.info("Starting audio capture...")
         if duration_seconds:
@@ -325,22 +517,56 @@ class USBAudioCapture:
         try:
             while self.is_capturing:
                 # Check duration limit
-                if duration_seconds and (time.time() - start_time) >= duration_seconds:
+                if self._frames_captured >= deadline_frames:
                     logger.info(f"Reached duration limit: {duration_seconds}s")
                     break
 
-                # Read audio data with timing
-                read_start = time.time()
-                length, data = self.pcm.read()
-                read_latency_ms = (time.time() - read_start) * 1000
+                # Read audio data (timed only when collecting diagnostics)
+                if diagnostics:
+                    read_start = perf_counter()
+                    length, data = read()
+                    read_latency_ms = (perf_counter() - read_start) * 1000
+                else:
+                    length, data = read()
 
                 if length > 0:
                     # Successfully read data
                     self._frames_captured += length
 
+                    if adaptive and self._frames_captured >= window_end:
+                        frames = self._frames_captured
+                        window_overruns = self._overruns - window_start_overruns
+                        window_start_overruns = self._overruns
+                        window_end = frames + window_frames
+                        periods = self.config.periods
+
+                        if window_overruns:
+                            last_overrun_frame = frames
+                        resized = True
+                        if (
+                            window_overruns > grow_overruns
+                            and periods < self.MAX_PERIODS
+                        ):
+                            resized = self._set_periods(periods + 1)
+                            read = self.pcm.read
+                        elif (
+                            frames - last_overrun_frame >= stable_frames
+                            and periods > self._min_periods
+                        ):
+                            resized = self._set_periods(periods - 1)
+                            read = self.pcm.read
+                            last_overrun_frame = frames
+                        if not resized:
+                            # Don't keep reopening a device that refused a
+                            # resize; stay at the current size this session
+                            adaptive = False
+                            logger.warning(
+                                "Adaptive periods disabled for this session"
+                            )
+
                     # Record diagnostics
-                    if self.diagnostics:
-                        self.diagnostics.record_chunk_read(len(data), read_latency_ms)
+                    if diagnostics:
+                        diagnostics.record_chunk_read(len(data), read_latency_ms)
 
                     # Call callback if provided
                     if callback:
@@ -351,15 +577,23 @@ class USBAudioCapture:
 
                     yield data
 
-                elif length == -alsaaudio.EPIPE:
+                elif length == epipe:
                     # Buffer overrun - we're not reading fast enough
                     self._overruns += 1
-                    if self.diagnostics:
-                        self.diagnostics.record_overrun()
-                    logger.warning(
-                        f"Buffer overrun detected (EPIPE) - overrun #{self._overruns}. "
-                        f"Consider increasing period_size or periods."
-                    )
+                    if diagnostics:
+                        diagnostics.record_overrun()
+                    # Log at most once per second; logging every overrun
+                    # during an xrun storm can cause the next one
+                    now = time.monotonic()
+                    if now - last_overrun_log >= 1.0:
+                        logger.warning(
+                            f"Buffer overrun detected (EPIPE) - "
+                            f"{self._overruns - overruns_logged} since last report, "
+                            f"{self._overruns} total. "
+                            f"Consider increasing period_size or periods."
+                        )
+                        overruns_logged = self._overruns
+                        last_overrun_log = now
                     # Continue capturing (ALSA recovers automatically)
 
                 elif length < 0:
@@ -372,7 +606,7 @@ class USBAudioCapture:
 
         finally:
             self.is_capturing = False
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             logger.info(
                 f"Capture stopped. "
                 f"Duration: {elapsed:.2f}s, "
@@ -380,6 +614,167 @@ class USBAudioCapture:
                 f"Overruns: {self._overruns}"
             )
 
+    def _set_periods(self, periods: int) -> bool:
+        """
+        Reopen the device with a different number of periods.
+
+        If the reopen fails (device busy, USB hiccup, unsupported buffer
+        size), the device is reopened with the previous period count so
+        capture carries on.
+
+        Args:
+            periods: New number of periods in the ALSA buffer
+
+        Returns:
+            True if the new period count is in effect, False if capture
+            continues with the previous one
+
+        Raises:
+            CaptureError: If the device cannot be reopened at all
+        """
+        previous = self.config.periods
+        logger.info(
+            f"Adjusting capture buffer: {previous} -> {periods} periods "
+            f"({self._overruns} overrun(s) so far)"
+        )
+        self.pcm.close()
+        self.pcm = None
+        self.config.periods = periods
+        if self.open():
+            return True
+
+        logger.warning(f"Reopen with {periods} periods failed, reverting to {previous}")
+        self.config.periods = previous
+        if not self.open():
+            raise CaptureError(f"Failed to reopen device with {previous} periods")
+        return False
+
+    def capture_stream_batched(
+        self,
+        batch: int = 4,
+        callback: Optional[Callable[[bytes], None]] = None,
+        duration_seconds: Optional[float] = None,
+    ) -> Generator[bytes, None, None]:
+        """
+        Capture audio stream, yielding several periods per chunk.
+
+        Consumers that do per-chunk Python work pay that overhead once per
+        batch instead of once per period. Periods are copied into one
+        reused buffer and each batch is yielded as a single bytes object.
+
+        Args:
+            batch: Number of periods per yielded chunk
+            callback: Optional callback called with each batched chunk
+            duration_seconds: Optional duration limit in seconds
+
+        Yields:
+            Audio data as bytes (up to batch * period_bytes; the final
+            chunk may be shorter)
+
+        Raises:
+            CaptureError: If device not opened or critical capture error occurs
+
+        Example:
+            >>> for chunk in capture.capture_stream_batched(batch=8):
+            ...     process(chunk)  # ~170ms of audio at 1024-frame periods
+        """
+        if batch <= 1:
+            yield from self.capture_stream(callback, duration_seconds)
+            return
+
+        buf = bytearray(batch * self.config.period_bytes)
+        view = memoryview(buf)
+        offset = 0
+        count = 0
+
+        try:
+            for data in self.capture_stream(duration_seconds=duration_seconds):
+                end = offset + len(data)
+                if end > len(buf):
+                    # Short/odd-sized reads: grow rather than split a period
+                    view.release()
+                    buf.extend(bytes(end - len(buf)))
+                    view = memoryview(buf)
+                view[offset:end] = data
+                offset = end
+                count += 1
+
+                if count == batch:
+                    chunk = bytes(view[:offset])
+                    offset = 0
+                    count = 0
+                    if callback:
+                        try:
+                            callback(chunk)
+                        except Exception as e:
+                            logger.error(f"Callback error: {e}")
+                    yield chunk
+
+            if offset:
+                chunk = bytes(view[:offset])
+                if callback:
+                    try:
+                        callback(chunk)
+                    except Exception as e:
+                        logger.error(f"Callback error: {e}")
+                yield chunk
+        finally:
+            view.release()
+
+    def capture_to_fd(
+        self,
+        fileobj_or_fd: Union[int, BinaryIO],
+        duration_seconds: Optional[float] = None,
+        flush_bytes: int = 64 * 1024,
+    ) -> int:
+        """
+        Capture audio straight to a file descriptor.
+
+        Periods are gathered without copying and written with one writev()
+        per flush_bytes, so there is no per-chunk callback or file-object
+        buffering on the capture path.
+
+        Args:
+            fileobj_or_fd: Open file descriptor, or binary file object
+                     (flushed first, then written through its fileno())
+            duration_seconds: Optional duration limit in seconds. If None,
+                     captures until stop() is called or KeyboardInterrupt
+            flush_bytes: Bytes to gather before each write
+
+        Returns:
+            Total number of bytes written
+
+        Raises:
+            CaptureError: If device not opened or critical capture error occurs
+
+        Example:
+            >>> with open('output.raw', 'wb') as f:
+            ...     written = capture.capture_to_fd(f, duration_seconds=10)
+        """
+        if isinstance(fileobj_or_fd, int):
+            fd = fileobj_or_fd
+        else:
+            fileobj_or_fd.flush()
+            fd = fileobj_or_fd.fileno()
+
+        pending: list = []
+        pending_bytes = 0
+        total_bytes = 0
+
+        try:
+            for data in self.capture_stream(duration_seconds=duration_seconds):
+                pending.append(data)
+                pending_bytes += len(data)
+                if pending_bytes >= flush_bytes:
+                    total_bytes += _writev_all(fd, pending)
+                    pending.clear()
+                    pending_bytes = 0
+        finally:
+            if pending:
+                total_bytes += _writev_all(fd, pending)
+
+        return total_bytes
+
     def stop(self):
         """
         Stop capture stream.
@@ -491,16 +886,31 @@ if __name__ == "__main__":
     print("Press Ctrl+C to stop early")
     print()
 
-    # Track total bytes using mutable container for closure
-    stats = {"total_bytes": 0}
+    # Track totals using mutable container for closure
+    stats = {"total_bytes": 0, "pending_bytes": 0}
+
+    # Gather periods and write them with one writev() per ~64KB rather
+    # than one write() per period
+    flush_bytes = 64 * 1024
+    pending: list = []
 
     try:
-        with open(output_file, "wb") as f:
+        fd = os.open(output_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
 
-            def write_callback(data: bytes):
-                f.write(data)
-                stats["total_bytes"] += len(data)
+        def flush_pending():
+            if pending:
+                _writev_all(fd, pending)
+                pending.clear()
+                stats["pending_bytes"] = 0
 
+        def write_callback(data: bytes):
+            pending.append(data)
+            stats["pending_bytes"] += len(data)
+            stats["total_bytes"] += len(data)
+            if stats["pending_bytes"] >= flush_bytes:
+                flush_pending()
+
+        try:
             for chunk in capture.capture_stream(
                 callback=write_callback, duration_seconds=duration
             ):
@@ -508,6 +918,9 @@ if __name__ == "__main__":
                 if capture.frames_captured % (config.sample_rate // 4) == 0:
                     elapsed = capture.frames_captured / config.sample_rate
                     print(f"  {elapsed:.1f}s captured...", end="\r")
+        finally:
+            flush_pending()
+            os.close(fd)
 
     except KeyboardInterrupt:
         print("\nStopped by user")
@@ -4,10 +4,10 @@ If this plays audio, it proves SoCo/Sonos infrastructure works.
 If this fails, the problem is device configuration, not our code.
 """
 
-import time
-
 from soco import discover
 
+from turntabler.streaming import wait_for_playback
+
 
 def main():
     print("🔍 Discovering Sonos devices...")
@@ -20,7 +20,7 @@ def main():
     print(f"✅ Found {len(devices)} device(s)")
 
     # Get first device
-    device = list(devices)[0]
+    device = next(iter(devices))
     print(f"\n🎯 Target device: {device.player_name}")
 
     # Handle grouping - CRITICAL for grouped devices
@@ -38,15 +38,18 @@ def main():
     print(f"   Sending commands to: {playback_device.player_name}")
 
     # Check volume and mute state before testing
+    # Read each once: every property access is a SOAP round-trip
+    volume = playback_device.volume
+    muted = playback_device.mute
     print("\n📊 Device Status Before Test:")
-    print(f"  Volume: {playback_device.volume}%")
-    print(f"  Muted: {playback_device.mute}")
+    print(f"  Volume: {volume}%")
+    print(f"  Muted: {muted}")
 
-    if playback_device.volume == 0:
+    if volume == 0:
         print("\n⚠️  WARNING: Volume is at 0%. Increasing to 50% for test.")
         playback_device.volume = 50
 
-    if playback_device.mute:
+    if muted:
         print("\n⚠️  WARNING: Device is muted. Unmuting.")
         playback_device.mute = False
 
@@ -62,18 +65,14 @@ def main():
 
         # Monitor state transitions
         print("\n🔍 Monitoring playback state...")
-        for i in range(10):
-            time.sleep(1)
-            info = playback_device.get_current_transport_info()
-            state = info["current_transport_state"]
-            track = playback_device.get_current_track_info().get("title", "N/A")
-            print(f"  [{i + 1}s] State: {state:12} | Title: {track}")
-
-            if state == "PLAYING":
-                print("\n✅ ✅ ✅ AUDIO PLAYING FROM PUBLIC RADIO!")
-                print("   This means: SoCo, Sonos, network all work correctly.")
-                print("   Problem is specific to our FLAC file or server.")
-                return
+        state = wait_for_playback(playback_device, timeout=10)
+        print(f"  State: {state}")
+
+        if state == "PLAYING":
+            print("\n✅ ✅ ✅ AUDIO PLAYING FROM PUBLIC RADIO!")
+            print("   This means: SoCo, Sonos, network all work correctly.")
+            print("   Problem is specific to our FLAC file or server.")
+            return
 
         # If we get here, public URI didn't work either
         print("\n❌ Public radio didn't play either")
@@ -4,10 +4,11 @@ WAV is uncompressed, simplest audio format - good control test.
 """
 
 import socket
-import time
 
 from soco import discover
 
+from turntabler.streaming import wait_for_playback
+
 
 def get_my_ip():
     """Get local IP address on network"""
@@ -30,7 +31,7 @@ def main():
         print("❌ No Sonos devices found!")
         return
 
-    device = list(devices)[0]
+    device = next(iter(devices))
     print(f"\n🎯 Target device: {device.player_name} ({device.ip_address})")
 
     # Handle grouping - CRITICAL for grouped devices
@@ -48,15 +49,18 @@ def main():
     print(f"   Sending commands to: {playback_device.player_name}")
 
     # Check and adjust volume
+    # Read each once: every property access is a SOAP round-trip
+    volume = playback_device.volume
+    muted = playback_device.mute
     print("\n📊 Device Status:")
-    print(f"  Volume: {playback_device.volume}%")
-    print(f"  Muted: {playback_device.mute}")
+    print(f"  Volume: {volume}%")
+    print(f"  Muted: {muted}")
 
-    if playback_device.volume == 0:
+    if volume == 0:
         print("\n⚠️  Setting volume to 50% (was 0%)")
         playback_device.volume = 50
 
-    if playback_device.mute:
+    if muted:
         print("\n⚠️  Unmuting device (was muted)")
         playback_device.mute = False
 
@@ -78,18 +82,14 @@ def main():
         print("✅ WAV playback started")
         print("🔍 Monitoring state transitions...")
 
-        for i in range(10):
-            time.sleep(1)
-            info = playback_device.get_current_transport_info()
-            state = info["current_transport_state"]
-            track = playback_device.get_current_track_info().get("title", "N/A")
-            print(f"  [{i + 1}s] State: {state:12} | Title: {track}")
-
-            if state == "PLAYING":
-                print("\n✅ ✅ ✅ WAV AUDIO PLAYING!")
-                print("   This means: Format compatibility is OK")
-                print("   FLAC issue likely: Encoding parameters or codec mismatch")
-                return
+        state = wait_for_playback(playback_device, timeout=10)
+        print(f"  State: {state}")
+
+        if state == "PLAYING":
+            print("\n✅ ✅ ✅ WAV AUDIO PLAYING!")
+            print("   This means: Format compatibility is OK")
+            print("   FLAC issue likely: Encoding parameters or codec mismatch")
+            return
 
         print("\n❌ WAV didn't play either")
         print("   This suggests deeper issue (not FLAC-specific)")
@@ -0,0 +1,157 @@
+"""
+Unit tests for audio sources.
+"""
+
+import struct
+import wave
+from itertools import cycle, islice
+
+from turntabler.audio_source import AudioFormat, FileAudioSource
+
+FORMAT = AudioFormat()  # 4 bytes per frame (16-bit stereo)
+
+
+def write_wav(path, pcm: bytes):
+    """Write pcm as a 48kHz 16-bit stereo WAV file."""
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(48000)
+        w.writeframes(pcm)
+
+
+def expected_stream(pcm: bytes, n: int) -> bytes:
+    """First n bytes of pcm repeated end to end."""
+    return bytes(islice(cycle(pcm), n))
+
+
+def read_all(source, num_frames: int, count: int) -> list[bytes]:
+    return [source.read_chunk(num_frames) for _ in range(count)]
+
+
+def test_file_source_reads_data_chunk(tmp_path):
+    """Chunks come from the data chunk only, never the WAV header."""
+    pcm = bytes(range(256)) * 4
+    path = tmp_path / "tone.wav"
+    write_wav(path, pcm)
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        assert source.read_chunk(64) == pcm[:256]
+        assert source.read_chunk(64) == pcm[256:512]
+    finally:
+        source.close()
+
+
+def test_file_source_wraps_at_end_of_file(tmp_path):
+    """A chunk that crosses the end is filled from the start of the data."""
+    pcm = bytes(range(40))  # 10 frames
+    path = tmp_path / "short.wav"
+    write_wav(path, pcm)
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        chunks = read_all(source, 3, 10)  # 12 bytes each; 40 isn't a multiple
+    finally:
+        source.close()
+
+    assert all(len(chunk) == 12 for chunk in chunks)
+    assert b"".join(chunks) == expected_stream(pcm, 120)
+
+
+def test_file_source_chunk_larger_than_file(tmp_path):
+    """A chunk longer than the whole file loops the data several times."""
+    pcm = bytes(range(8))  # 2 frames
+    path = tmp_path / "tiny.wav"
+    write_wav(path, pcm)
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        chunks = read_all(source, 5, 3)  # 20 bytes each
+    finally:
+        source.close()
+
+    assert b"".join(chunks) == expected_stream(pcm, 60)
+
+
+def test_file_source_wrap_chunks_are_independent(tmp_path):
+    """Boundary chunks are copies, not views of the reused wrap buffer."""
+    pcm = bytes(range(12))  # 3 frames
+    path = tmp_path / "wrap.wav"
+    write_wav(path, pcm)
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        first = source.read_chunk(2)  # bytes 0-7
+        wrapped = source.read_chunk(2)  # bytes 8-11, 0-3
+        wrapped_again = source.read_chunk(2)  # bytes 4-11
+        after = source.read_chunk(2)  # bytes 0-7
+    finally:
+        source.close()
+
+    assert first == pcm[:8]
+    assert wrapped == pcm[8:] + pcm[:4]
+    assert wrapped_again == pcm[4:]
+    assert after == pcm[:8]
+
+
+def test_file_source_streaming_header_clamped_to_file(tmp_path):
+    """An 'infinite' data size (0xFFFFFFFF) is clamped to the file length."""
+    pcm = bytes(range(16))
+    header = (
+        b"RIFF"
+        + struct.pack("<I", 0xFFFFFFFF)
+        + b"WAVEfmt "
+        + struct.pack("<IHHIIHH", 16, 1, 2, 48000, 192000, 4, 16)
+        + b"data"
+        + struct.pack("<I", 0xFFFFFFFF)
+    )
+    path = tmp_path / "stream.wav"
+    path.write_bytes(header + pcm)
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        chunks = read_all(source, 3, 4)
+    finally:
+        source.close()
+
+    assert b"".join(chunks) == expected_stream(pcm, 48)
+
+
+def test_file_source_raw_pcm(tmp_path):
+    """Files without a RIFF header are read as raw PCM from byte 0."""
+    pcm = bytes(range(20))
+    path = tmp_path / "audio.raw"
+    path.write_bytes(pcm)
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        chunks = read_all(source, 2, 5)
+    finally:
+        source.close()
+
+    assert b"".join(chunks) == expected_stream(pcm, 40)
+
+
+def test_file_source_empty_file(tmp_path):
+    """An empty file yields no audio instead of failing to map."""
+    path = tmp_path / "empty.wav"
+    path.write_bytes(b"")
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        assert source.read_chunk(1024) is None
+    finally:
+        source.close()
+
+
+def test_file_source_header_without_data(tmp_path):
+    """A WAV file with no audio frames yields no audio."""
+    path = tmp_path / "silent.wav"
+    write_wav(path, b"")
+
+    source = FileAudioSource(str(path), FORMAT)
+    try:
+        assert source.read_chunk(1024) is None
+    finally:
+        source.close()
@@ -0,0 +1,88 @@
+"""
+Unit tests for the streaming orchestrator's Sonos playback wait.
+"""
+
+import queue
+import time
+import types
+
+from turntabler.streaming import wait_for_playback
+
+
+class FakeSubscription:
+    """AVTransport subscription that delivers a fixed list of events."""
+
+    def __init__(self, states: list[str]):
+        self.events = queue.Queue()
+        for state in states:
+            self.events.put(types.SimpleNamespace(variables={"transport_state": state}))
+        self.unsubscribed = False
+
+    def unsubscribe(self):
+        self.unsubscribed = True
+
+
+class FakeDevice:
+    """Sonos device with a scripted event subscription and transport state."""
+
+    def __init__(self, states: list[str], polled_state: str = "PLAYING"):
+        self.subscription = FakeSubscription(states)
+        self.polled_state = polled_state
+        self.polls = 0
+        self.avTransport = types.SimpleNamespace(subscribe=self._subscribe)
+
+    def _subscribe(self, **kwargs):
+        return self.subscription
+
+    def get_current_transport_info(self):
+        self.polls += 1
+        return {"current_transport_state": self.polled_state}
+
+
+def test_returns_playing_from_events_without_polling():
+    device = FakeDevice(["TRANSITIONING", "PLAYING"])
+
+    assert wait_for_playback(device, timeout=1.0) == "PLAYING"
+    assert device.polls == 0
+    assert device.subscription.unsubscribed
+
+
+def test_returns_stopped_from_events():
+    device = FakeDevice(["TRANSITIONING", "STOPPED"], polled_state="PLAYING")
+
+    assert wait_for_playback(device, timeout=1.0) == "STOPPED"
+    assert device.polls == 0
+
+
+def test_polls_once_when_events_never_settle():
+    """No PLAYING/STOPPED event: wait out the timeout, then poll once."""
+    device = FakeDevice(["TRANSITIONING"])
+
+    start = time.monotonic()
+    state = wait_for_playback(device, timeout=0.3)
+    elapsed = time.monotonic() - start
+
+    assert state == "PLAYING"
+    assert device.polls == 1
+    assert 0.3 <= elapsed < 1.0
+    assert device.subscription.unsubscribed
+
+
+def test_polls_once_when_no_events_arrive():
+    """A blocked event listener (no NOTIFY at all) still reports the state."""
+    device = FakeDevice([], polled_state="TRANSITIONING")
+
+    assert wait_for_playback(device, timeout=0.2) == "TRANSITIONING"
+    assert device.polls == 1
+
+
+def test_polls_once_when_subscription_fails():
+    device = FakeDevice([])
+
+    def subscribe(**kwargs):
+        raise OSError("event listener unavailable")
+
+    device.avTransport.subscribe = subscribe
+
+    assert wait_for_playback(device, timeout=5.0) == "PLAYING"
+    assert device.polls == 1
@@ -0,0 +1,41 @@
+"""
+Unit tests for the WAV streaming server's client fan-out.
+"""
+
+from turntabler.audio_source import AudioFormat, AudioSource
+from turntabler.streaming_wav import WAVStreamingServer
+
+
+class FixedChunkSource(AudioSource):
+    """Audio source that yields a fixed number of chunks, then ends."""
+
+    def __init__(self, chunks: list[bytes]):
+        self.chunks = list(chunks)
+
+    def read_chunk(self, num_frames: int):
+        return self.chunks.pop(0) if self.chunks else None
+
+    def close(self):
+        pass
+
+
+def test_unsubscribe_keeps_other_client_queue():
+    """Unsubscribing one client must not remove another client's queue."""
+    chunks = [b"\x01" * 4, b"\x02" * 4, b"\x03" * 4]
+    server = WAVStreamingServer(
+        audio_source=FixedChunkSource(chunks), wav_format=AudioFormat()
+    )
+
+    # Both queues start empty, so they compare equal by value
+    queue_a = server._subscribe()
+    queue_b = server._subscribe()
+    server._unsubscribe(queue_b)
+
+    assert len(server._subscribers) == 1
+    assert server._subscribers[0] is queue_a
+
+    server.start_producer()
+    server._producer_thread.join(timeout=2.0)
+
+    assert server._take_from_buffer(queue_a) == b"".join(chunks)
+    assert not queue_b
@@ -0,0 +1,183 @@
+"""
+Unit tests for USB audio device enumeration and selection.
+"""
+
+import random
+import types
+
+import pytest
+
+from turntabler import usb_audio
+from turntabler.usb_audio import USBAudioDeviceManager
+
+
+class FakeClock:
+    """Stand-in for the time module with a manually advanced monotonic()."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(
+        usb_audio, "time", types.SimpleNamespace(monotonic=fake.monotonic)
+    )
+    return fake
+
+
+@pytest.fixture
+def alsa_devices(monkeypatch, clock, tmp_path):
+    """
+    Replace ALSA enumeration with a settable device list.
+
+    Returns a namespace with `devices` (list handed to pcms()) and
+    `calls` (number of enumerations performed).
+    """
+    state = types.SimpleNamespace(devices=[], calls=0)
+
+    def pcms(kind):
+        state.calls += 1
+        return list(state.devices)
+
+    monkeypatch.setattr(usb_audio.alsaaudio, "pcms", pcms, raising=False)
+    monkeypatch.setattr(USBAudioDeviceManager, "_cache", None)
+    monkeypatch.setattr(USBAudioDeviceManager, "_cards_cache", None)
+    monkeypatch.setattr(usb_audio, "PROC_ASOUND_CARDS", str(tmp_path / "cards"))
+    return state
+
+
+def hw(card: str, dev: int = 0) -> str:
+    return f"hw:CARD={card},DEV={dev}"
+
+
+def reference_find_device(card_names: list[str], pattern=None):
+    """Index chosen by the original nested-loop implementation."""
+    lowered = [name.lower() for name in card_names]
+    if not pattern:
+        for pref in USBAudioDeviceManager.PREFERRED_DEVICE_PATTERNS:
+            for i, name in enumerate(lowered):
+                if pref.lower() in name:
+                    return i
+    internal = [p.lower() for p in USBAudioDeviceManager.INTERNAL_CARD_PATTERNS]
+    usb = [i for i, name in enumerate(lowered) if not any(p in name for p in internal)]
+    return usb[0] if usb else None
+
+
+def test_preferred_pattern_order(alsa_devices):
+    """CODEC outranks UCA regardless of enumeration order."""
+    alsa_devices.devices = [hw("UCA222"), hw("Scarlett"), hw("CODEC")]
+    assert USBAudioDeviceManager.find_device().card_name == "CODEC"
+
+
+def test_preferred_ties_keep_enumeration_order(alsa_devices):
+    alsa_devices.devices = [hw("Scarlett"), hw("UCA202"), hw("UCA222")]
+    assert USBAudioDeviceManager.find_device().card_name == "UCA202"
+
+
+def test_preferred_match_is_case_insensitive(alsa_devices):
+    alsa_devices.devices = [hw("Generic"), hw("UsbCodec")]
+    assert USBAudioDeviceManager.find_device().card_name == "UsbCodec"
+
+
+def test_internal_cards_filtered(alsa_devices):
+    """Without a preferred device, the first non-internal card is chosen."""
+    alsa_devices.devices = [
+        hw("PCH"),
+        hw("intel_hdmi"),
+        hw("Analog"),
+        hw("Scarlett"),
+        hw("Other"),
+    ]
+    assert USBAudioDeviceManager.find_device().card_name == "Scarlett"
+
+
+def test_only_internal_cards(alsa_devices):
+    alsa_devices.devices = [hw("PCH"), hw("HDA")]
+    assert USBAudioDeviceManager.find_device() is None
+
+
+def test_explicit_pattern_skips_internal_and_preferred(alsa_devices):
+    alsa_devices.devices = [hw("CODEC"), hw("HDA_Scarlett"), hw("Scarlett")]
+    assert USBAudioDeviceManager.find_device("scar").card_name == "Scarlett"
+
+
+def test_invalid_pattern_returns_none(alsa_devices):
+    alsa_devices.devices = [hw("Scarlett")]
+    assert USBAudioDeviceManager.find_device("[") is None
+
+
+def test_matches_reference_selection(alsa_devices):
+    """Ranking and filtering agree with the original loop on random lists."""
+    parts = [
+        "CODEC", "codec", "UCA", "uca2", "PCH", "Intel", "analog", "HDA",
+        "Built-in", "USB", "Scarlett", "X", "",
+    ]
+    rng = random.Random(1234)
+
+    for _ in range(500):
+        names = [
+            "".join(rng.choice(parts) for _ in range(rng.randint(1, 3))) or "Card"
+            for _ in range(rng.randint(0, 6))
+        ]
+        alsa_devices.devices = [hw(name, i) for i, name in enumerate(names)]
+        USBAudioDeviceManager._cache = None
+
+        expected = reference_find_device(names)
+        device = USBAudioDeviceManager.find_device()
+        if expected is None:
+            assert device is None, names
+        else:
+            assert device is not None and device.device_number == expected, names
+
+
+def test_list_capture_devices_parses_hw_names(alsa_devices, tmp_path):
+    """Only hw:CARD= devices are listed; card numbers come from /proc."""
+    (tmp_path / "cards").write_text(
+        " 0 [PCH            ]: HDA-Intel - HDA Intel PCH\n"
+        "                      HDA Intel PCH at 0xf7f10000 irq 32\n"
+        " 1 [CODEC          ]: USB-Audio - USB Audio CODEC\n"
+        "                      Burr-Brown from TI USB Audio CODEC at usb-...\n"
+    )
+    alsa_devices.devices = [
+        "default",
+        "sysdefault:CARD=PCH",
+        hw("PCH"),
+        hw("CODEC", 1),
+        hw("Unplugged"),
+    ]
+
+    devices = USBAudioDeviceManager.list_capture_devices()
+
+    assert [(d.card_name, d.card_number, d.device_number) for d in devices] == [
+        ("PCH", 0, 0),
+        ("CODEC", 1, 1),
+        ("Unplugged", -1, 0),
+    ]
+
+
+def test_scan_cached_until_ttl_expires(alsa_devices, clock):
+    alsa_devices.devices = [hw("CODEC")]
+
+    USBAudioDeviceManager.list_capture_devices()
+    clock.now += USBAudioDeviceManager.CACHE_TTL / 2
+    USBAudioDeviceManager.find_device()
+    assert alsa_devices.calls == 1
+
+    # A newly plugged device shows up once the cache expires
+    alsa_devices.devices = [hw("CODEC"), hw("UCA222")]
+    clock.now += USBAudioDeviceManager.CACHE_TTL
+    assert len(USBAudioDeviceManager.list_capture_devices()) == 2
+    assert alsa_devices.calls == 2
+
+
+def test_scan_cache_ttl_zero_forces_rescan(alsa_devices):
+    alsa_devices.devices = [hw("CODEC")]
+
+    USBAudioDeviceManager.list_capture_devices()
+    USBAudioDeviceManager.list_capture_devices(cache_ttl=0)
+    assert alsa_devices.calls == 2
@@ -0,0 +1,242 @@
+"""
+Unit tests for USB audio capture, run against a scripted ALSA PCM.
+"""
+
+import os
+import types
+
+import pytest
+
+from turntabler import usb_audio_capture
+from turntabler.usb_audio_capture import CaptureConfig, USBAudioCapture, _writev_all
+
+
+@pytest.fixture
+def fake_pcm(monkeypatch):
+    """
+    Replace alsaaudio.PCM with a scripted capture device.
+
+    Each read returns one period filled with the global read index (mod
+    256), or an overrun when `overrun(periods, index)` is true. Opening
+    with a period count in `refuse` fails like a busy device.
+
+    Returns a namespace with the script settings and `opens`, the list of
+    (periods, succeeded) for every open attempt.
+    """
+    alsa = usb_audio_capture.alsaaudio
+    state = types.SimpleNamespace(
+        overrun=lambda periods, index: False, refuse=set(), opens=[], reads=0
+    )
+
+    class FakePCM:
+        def __init__(self, **kwargs):
+            periods = kwargs["periods"]
+            if periods in state.refuse:
+                state.opens.append((periods, False))
+                raise alsa.ALSAAudioError("Device or resource busy")
+            state.opens.append((periods, True))
+            self.periods = periods
+            self.period_bytes = kwargs["periodsize"] * kwargs["channels"] * 2
+
+        def read(self):
+            index = state.reads
+            state.reads += 1
+            if state.overrun(self.periods, index):
+                return -alsa.EPIPE, b""
+            return self.period_bytes // 4, bytes([index % 256]) * self.period_bytes
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(alsa, "PCM", FakePCM, raising=False)
+    return state
+
+
+def expected_capture(reads: int, period_bytes: int) -> bytes:
+    return b"".join(bytes([i % 256]) * period_bytes for i in range(reads))
+
+
+def seconds(periods: int, config: CaptureConfig) -> float:
+    """Capture duration covering exactly this many periods."""
+    return periods * config.period_size / config.sample_rate
+
+
+# --- _writev_all / capture_to_fd ---
+
+
+@pytest.fixture
+def short_writev(monkeypatch):
+    """os.writev that accepts at most 7 bytes per call; records batch sizes."""
+    real_writev = os.writev
+    batches = []
+
+    def writev(fd, buffers):
+        batches.append(len(buffers))
+        data = b"".join(bytes(b) for b in buffers)[:7]
+        return real_writev(fd, [data])
+
+    monkeypatch.setattr(os, "writev", writev)
+    return batches
+
+
+def test_writev_all_resumes_after_short_writes(tmp_path, short_writev):
+    buffers = [b"abc", b"", bytearray(b"defghij"), memoryview(b"klmnopqrstu"), b"vw"]
+    path = tmp_path / "out.raw"
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+    try:
+        assert _writev_all(fd, buffers) == 23
+    finally:
+        os.close(fd)
+
+    assert path.read_bytes() == b"abcdefghijklmnopqrstuvw"
+    assert len(short_writev) == 4
+
+
+def test_writev_all_limits_buffers_per_call(tmp_path, monkeypatch):
+    monkeypatch.setattr(usb_audio_capture, "_IOV_MAX", 4)
+    real_writev = os.writev
+    batches = []
+
+    def writev(fd, buffers):
+        batches.append(len(buffers))
+        return real_writev(fd, buffers)
+
+    monkeypatch.setattr(os, "writev", writev)
+    buffers = [bytes([i]) * 3 for i in range(10)]
+    path = tmp_path / "out.raw"
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT)
+    try:
+        assert _writev_all(fd, buffers) == 30
+    finally:
+        os.close(fd)
+
+    assert path.read_bytes() == b"".join(buffers)
+    assert batches == [4, 4, 2]
+
+
+def test_writev_all_raises_when_no_progress(monkeypatch):
+    monkeypatch.setattr(os, "writev", lambda fd, buffers: 0)
+    with pytest.raises(OSError):
+        _writev_all(1, [b"data"])
+
+
+def test_capture_to_fd_writes_every_period(tmp_path, fake_pcm, short_writev):
+    """Short writes don't lose audio, including the final partial batch."""
+    config = CaptureConfig()
+    capture = USBAudioCapture(config)
+    assert capture.open()
+    path = tmp_path / "capture.raw"
+
+    with open(path, "wb") as f:
+        written = capture.capture_to_fd(
+            f,
+            duration_seconds=seconds(10, config),
+            flush_bytes=3 * config.period_bytes,
+        )
+    capture.close()
+
+    expected = expected_capture(10, config.period_bytes)
+    assert written == len(expected)
+    assert path.read_bytes() == expected
+
+
+# --- Adaptive periods ---
+
+
+def run_adaptive(config: CaptureConfig, duration_seconds: float) -> USBAudioCapture:
+    capture = USBAudioCapture(config, adaptive_periods=True)
+    assert capture.open()
+    for _ in capture.capture_stream(duration_seconds=duration_seconds):
+        pass
+    return capture
+
+
+def test_adaptive_grows_on_overruns(fake_pcm):
+    """Overruns above GROW_OVERRUN_RATE add one period per window."""
+    fake_pcm.overrun = lambda periods, index: periods == 3 and index % 100 == 0
+
+    capture = run_adaptive(CaptureConfig(), 12.0)
+
+    assert fake_pcm.opens == [(3, True), (4, True)]
+    assert capture.config.periods == 4
+
+
+def test_adaptive_grows_one_period_per_window(fake_pcm):
+    """Persistent overruns grow the buffer once per GROW_WINDOW_SECONDS."""
+    fake_pcm.overrun = lambda periods, index: index % 100 == 0
+
+    capture = run_adaptive(CaptureConfig(), 12.0)  # windows end at 5s and 10s
+
+    assert fake_pcm.opens == [(3, True), (4, True), (5, True)]
+    assert capture.config.periods == 5
+
+
+def test_adaptive_grows_no_further_than_max(fake_pcm, monkeypatch):
+    monkeypatch.setattr(USBAudioCapture, "MAX_PERIODS", 4)
+    fake_pcm.overrun = lambda periods, index: index % 100 == 0
+
+    capture = run_adaptive(CaptureConfig(), 22.0)
+
+    assert fake_pcm.opens == [(3, True), (4, True)]
+    assert capture.config.periods == 4
+
+
+def test_adaptive_shrinks_after_stable_period(fake_pcm):
+    """After SHRINK_STABLE_SECONDS without overruns, one period is removed."""
+    # Overruns only in the first few seconds of the session
+    fake_pcm.overrun = lambda periods, index: index < 200 and index % 50 == 0
+
+    capture = run_adaptive(CaptureConfig(), 40.0)
+
+    assert fake_pcm.opens == [(3, True), (4, True), (3, True)]
+    assert capture.config.periods == 3
+
+
+def test_adaptive_never_shrinks_below_configured_periods(fake_pcm):
+    capture = run_adaptive(CaptureConfig(periods=3), 40.0)
+
+    assert fake_pcm.opens == [(3, True)]
+    assert capture.config.periods == 3
+
+
+def test_adaptive_falls_back_when_reopen_fails(fake_pcm):
+    """A refused resize reopens at the previous size and keeps capturing."""
+    config = CaptureConfig()
+    fake_pcm.overrun = lambda periods, index: index % 100 == 0
+    fake_pcm.refuse = {4}
+
+    capture = run_adaptive(config, 22.0)
+
+    # One refused attempt, then adaptation stays off for the session
+    assert fake_pcm.opens == [(3, True), (4, False), (3, True)]
+    assert capture.config.periods == 3
+    assert capture.pcm is not None
+    assert capture._frames_captured >= int(22.0 * config.sample_rate)
+
+
+def test_adaptive_raises_when_fallback_reopen_fails(fake_pcm):
+    fake_pcm.overrun = lambda periods, index: index % 100 == 0
+    capture = USBAudioCapture(CaptureConfig(), adaptive_periods=True)
+    assert capture.open()
+
+    stream = capture.capture_stream(duration_seconds=12.0)
+    next(stream)
+    fake_pcm.refuse = {3, 4}
+
+    with pytest.raises(usb_audio_capture.CaptureError):
+        for _ in stream:
+            pass
+    assert fake_pcm.opens == [(3, True), (4, False), (3, False)]
+
+
+def test_fixed_periods_never_reopen(fake_pcm):
+    fake_pcm.overrun = lambda periods, index: index % 10 == 0
+    capture = USBAudioCapture(CaptureConfig())
+    assert capture.open()
+
+    for _ in capture.capture_stream(duration_seconds=12.0):
+        pass
+
+    assert fake_pcm.opens == [(3, True)]